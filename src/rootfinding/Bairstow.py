@@ -1,5 +1,5 @@
+from functools import partial
 import numpy as np
-import matplotlib.pyplot as plt
 """Bairstow's Method Implementation.
 
 Polynomial Solver, including complex roots, by extracting a quadratic
@@ -78,6 +78,98 @@ def quo(a, u, v):
     return b[2:]
 
 
+def workspace(n):
+    """Allocate buffers for quo2 that can be reused.
+
+    Parameters
+    ----------
+    n : int
+        Largest degree that will be divided.
+
+    Returns
+    -------
+    tuple of two lists of float
+        Buffers b and c, each with two leading zeros.
+    """
+    return [0.0]*(n + 3), [0.0]*(n + 3)
+
+
+def quo2(a, u, v, b, c):
+    """Fused double synthetic division into preallocated buffers.
+
+    Computes the quotient b of a by (x²-ux-v), the same as quo, and in the
+    same pass the quotient c of b that Bairstow's method needs for its
+    partial derivatives:
+
+    b_i = a_i + u*b_{i-1} + v*b_{i-2}
+
+    c_i = b_i + u*c_{i-1} + v*c_{i-2}
+
+    Nothing is allocated. Coefficient b_i is stored at b[i+2] so that
+    b[0] and b[1] stay zero, likewise for c. Buffers may be longer than
+    needed so one workspace serves every deflation step.
+
+    Parameters
+    ----------
+    a : list of float
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c].
+    u : float
+        The coefficient in (x²-ux-v).
+    v : float
+        The coefficient in (x²-ux-v).
+    b : list of float
+        Buffer from workspace for the quotient including remainder.
+    c : list of float
+        Buffer from workspace for the quotient of b.
+
+    See Also
+    --------
+    quo : Quotient.
+    workspace : Buffers for quo2.
+    """
+    n = len(a) - 1
+    b1 = b0 = c1 = c0 = 0.0  # previous two terms kept in locals
+    for i in range(n):
+        bi = a[i] + u*b1 + v*b0
+        ci = bi + u*c1 + v*c0
+        b[i+2] = bi
+        c[i+2] = ci
+        b0, b1, c0, c1 = b1, bi, c1, ci
+    b[n+2] = a[n] + u*b1 + v*b0
+
+
+def quoGrid(a, u, v):
+    """Determine the quotient of a polynomial for arrays of u and v.
+
+    Same synthetic division as quo, but u and v are NumPy arrays so
+    every (u, v) pair is divided at once. Row i of the result holds
+    coefficient b_i for every pair.
+
+    Parameters
+    ----------
+    a : list of float or ndarray
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c].
+        May also be a 2-D array with one row per coefficient.
+    u : ndarray
+        The coefficients in (x²-ux-v).
+    v : ndarray
+        The coefficients in (x²-ux-v).
+
+    Returns
+    -------
+    ndarray
+        Quotient q(x) coefficients including remainder, one row each.
+
+    See Also
+    --------
+    quo : Quotient.
+    """
+    b = np.zeros((len(a) + 2,) + np.shape(u))
+    for i in range(len(a)):
+        b[i+2] = a[i] + u*b[i+1] + v*b[i]
+    return b[2:]
+
+
 def quadratic(u, v):
     """Quadratic equation for x² - ux - v for finding roots.
 
@@ -106,7 +198,7 @@ def quadratic(u, v):
     return ((u+disc)/2, (u-disc)/2)
 
 
-def bairstow(a, u, v, eps=10**(-12), max=50, count=False):
+def bairstow(a, u, v, eps=10**(-12), max=50, count=False, work=None):
     """Find quotient of polynomial using Bairstow's method.
     
     Coefficients given in list a and terms u and v of quadtratic.
@@ -135,6 +227,9 @@ def bairstow(a, u, v, eps=10**(-12), max=50, count=False):
     count : bool, optional
         Default to false. When True, return the number of iterations
         it took to find final values for u and v.
+    work : tuple of two lists, optional
+        Buffers from workspace at least len(a) - 1 in degree. Pass the
+        same workspace to every call to avoid allocating.
 
     Returns
     -------
@@ -145,32 +240,353 @@ def bairstow(a, u, v, eps=10**(-12), max=50, count=False):
     
     See Also
     --------
-    quo : Quotient.
+    quo2 : Fused quotient.
     """
     i = 0
     n = len(a) - 1  # length of c
-    b = quo(a, u, v)
-    while (abs(b[-1]) > eps or abs(b[-2]) > eps) and i < max:
-        c = quo(b, u, v)[:-1]
-        denom = c[n-2]**2 - c[n-1]*c[n-3]
-        du = (b[n]*c[n-3] - b[n-1]*c[n-2]) / denom  # b_n-1 typo in henrici
-        dv = (b[n-1]*c[n-1] - b[n]*c[n-2]) / denom
+    b, c = work if work is not None else workspace(n)
+    quo2(a, u, v, b, c)  # b_k is b[k+2] and c_k is c[k+2]
+    while (abs(b[n+2]) > eps or abs(b[n+1]) > eps) and i < max:
+        denom = c[n]*c[n] - c[n+1]*c[n-1]  # not **2, pow can be an ulp off the lockstep square
+        du = (b[n+2]*c[n-1] - b[n+1]*c[n]) / denom  # b_n-1 typo in henrici
+        dv = (b[n+1]*c[n+1] - b[n+2]*c[n]) / denom
         u += du
         v += dv
         i += 1
-        b = quo(a, u, v)
-    return i if count else  (b[:-2], u, v)
+        quo2(a, u, v, b, c)
+    return i if count else  (b[2:n+1], u, v)
+
+
+def lockstep(a, u, v, eps=10**(-12), max=50):
+    """Run Bairstow's method in lockstep on 1-D arrays of u and v.
+
+    Pairs whose remainder has dropped below eps are masked out so only
+    the pairs still iterating cost work. Every pair follows exactly the
+    same arithmetic as bairstow.
+
+    Parameters
+    ----------
+    a : list of float or ndarray
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c]
+        shared by every pair, or a 2-D array with one column of
+        coefficients per pair.
+    u : ndarray
+        Initial values for the coefficient in (x²-ux-v). Updated in place.
+    v : ndarray
+        Initial values for the coefficient in (x²-ux-v). Updated in place.
+    eps : float, optional
+        Default epsilon value is 10^{-12}.
+    max : int, optional
+        Default maximum iteration count is 50.
+
+    Returns
+    -------
+    ndarray of int
+        Number of iterations for each pair.
+    """
+    batch = isinstance(a, np.ndarray) and a.ndim == 2
+    count = np.zeros(u.size, dtype=int)
+    active = np.arange(u.size)  # pairs still iterating
+    n = len(a) - 1
+    i = 0
+    with np.errstate(all='ignore'):  # diverging pairs become inf/nan like the scalar version
+        while active.size and i < max:
+            ua = u[active]
+            va = v[active]
+            aa = a[:, active] if batch else a
+            b = quoGrid(aa, ua, va)
+            going = (abs(b[-1]) > eps) | (abs(b[-2]) > eps)
+            active, ua, va, b = active[going], ua[going], va[going], b[:, going]
+            c = quoGrid(b, ua, va)[:-1]
+            denom = c[n-2]*c[n-2] - c[n-1]*c[n-3]  # same arithmetic as bairstow
+            du = (b[n]*c[n-3] - b[n-1]*c[n-2]) / denom
+            dv = (b[n-1]*c[n-1] - b[n]*c[n-2]) / denom
+            u[active] = ua + du
+            v[active] = va + dv
+            i += 1
+            count[active] = i
+    return count
+
+
+def bairstowGrid(a, u, v, eps=10**(-12), max=50):
+    """Count Bairstow iterations for whole arrays of starting u and v.
+
+    Runs bairstow in lockstep on every (u, v) pair. Gives the same counts
+    as bairstow(a, u, v, eps, max, count=True) called on each pair.
+
+    Parameters
+    ----------
+    a : list of float
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c].
+    u : array_like
+        Initial values for the coefficient in (x²-ux-v).
+    v : array_like
+        Initial values for the coefficient in (x²-ux-v).
+    eps : float, optional
+        Default epsilon value is 10^{-12}.
+    max : int, optional
+        Default maximum iteration count is 50.
+
+    Returns
+    -------
+    ndarray of int
+        Number of iterations for each (u, v) pair, shaped like u and v.
+
+    See Also
+    --------
+    bairstow : Bairstow's method for a single u and v.
+    lockstep : The batched iteration.
+    """
+    u, v = np.broadcast_arrays(np.asarray(u, dtype=float), np.asarray(v, dtype=float))
+    shape = u.shape
+    count = lockstep(a, u.ravel().copy(), v.ravel().copy(), eps, max)
+    return count.reshape(shape)
 
-def allRoots(p):
+
+def cauchy(a):
+    """Cauchy's lower bound on the moduli of the roots.
+
+    Every root of p(x) has modulus at least β, the one positive root of
+
+    |a_0|x^n + |a_1|x^{n-1} + ... + |a_{n-1}|x - |a_n| = 0
+
+    found with Newton's method. Starting at (|a_n|/|a_0|)^{1/n}, which is
+    never below β, Newton decreases monotonically to it.
+
+    Parameters
+    ----------
+    a : list of float or ndarray
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c], or a
+        2-D array with one column of coefficients per polynomial.
+
+    Returns
+    -------
+    float or ndarray
+        β for each polynomial.
+    """
+    q = abs(np.asarray(a, dtype=float))
+    n = len(q) - 1
+    x = (q[-1] / q[0])**(1/n)
+    for _ in range(100):
+        f = q[0]
+        df = 0*x
+        for i in range(1, n):
+            df = df*x + f
+            f = f*x + q[i]
+        df = df*x + f
+        f = f*x - q[n]
+        step = np.where(df > 0, f / np.where(df > 0, df, 1), 0)
+        x = x - step
+        if np.all(step <= 10**(-3)*x):
+            break
+    return x
+
+
+def fujiwara(a):
+    """Fujiwara's upper bound on the moduli of the roots.
+
+    2 max(|a_1/a_0|, |a_2/a_0|^{1/2}, ..., |a_n/(2a_0)|^{1/n})
+
+    Parameters
+    ----------
+    a : list of float or ndarray
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c], or a
+        2-D array with one column of coefficients per polynomial.
+
+    Returns
+    -------
+    float or ndarray
+        The bound for each polynomial.
+    """
+    q = abs(np.asarray(a, dtype=float))
+    n = len(q) - 1
+    r = [(q[i] / q[0])**(1/i) for i in range(1, n)] + [(q[n] / (2*q[0]))**(1/n)]
+    return 2*np.max(r, axis=0)
+
+
+def seed(a, k, tries=6):
+    """Starting u and v for attempt k at a quadratic factor.
+
+    Attempt 0 is the classic u = v = 1, which is cheapest on most small
+    polynomials. Attempt 1 uses the trailing quadratic a_{n-2}x² +
+    a_{n-1}x + a_n, whose roots approximate the two smallest roots of
+    p(x). Later attempts place a conjugate pair ρe^{±iθ} on circles from
+    Cauchy's lower bound out to Fujiwara's upper bound, turning θ by 94°
+    each time, which gives u = 2ρcos(θ) and v = -ρ².
+
+    Parameters
+    ----------
+    a : list of float or ndarray
+        The monic polynomial coefficients p(x) = x² + bx + c --> [1,b,c],
+        or a 2-D array with one column of coefficients per polynomial.
+    k : int
+        The attempt, starting from 0.
+    tries : int, optional
+        Total number of attempts. Default 6.
+
+    Returns
+    -------
+    tuple of two floats or ndarray
+        Initial u and v in (x²-ux-v).
+    """
+    with np.errstate(all='ignore'):
+        low = cauchy(a)
+        ratio = fujiwara(a) / low
+        j = max(k - 2, 0)
+        rho = low * np.where(ratio > 1, ratio, 1)**(j / max(tries - 3, 1))
+        theta = np.pi/4 + j*94*np.pi/180
+        u = 2*rho*np.cos(theta)
+        v = -rho**2
+        if k == 0:
+            u = 1 + 0*u
+            v = 1 + 0*v
+        if k == 1:
+            a2 = np.asarray(a[-3], dtype=float)
+            trail = (a2 != 0) & np.isfinite(a[-2] / a2) & np.isfinite(a[-1] / a2)
+            u = np.where(trail, -np.asarray(a[-2]) / np.where(trail, a2, 1), u)
+            v = np.where(trail, -np.asarray(a[-1]) / np.where(trail, a2, 1), v)
+        u = np.where(np.isfinite(u), u, 1)  # fall back to u=1, v=1
+        v = np.where(np.isfinite(v), v, 1)
+    if np.ndim(a[0]) == 0:
+        return float(u), float(v)
+    return u, v
+
+
+def polish(p, roots, eps=10**(-14), max=10):
+    """Polish roots with Newton's method against the original polynomial.
+
+    Deflation leaves later roots with the rounding error of every earlier
+    quotient. A few Newton steps on p(x) itself remove it.
+
+    Parameters
+    ----------
+    p : list of float or ndarray
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c], or a
+        2-D array with one polynomial per row.
+    roots : list of complex or ndarray
+        Roots of p(x), one row per polynomial when p is 2-D.
+    eps : float, optional
+        Relative step size to stop at. Default 10^{-14}.
+    max : int, optional
+        Default maximum iteration count is 10.
+
+    Returns
+    -------
+    ndarray of complex
+        Polished roots.
+    """
+    P = np.atleast_2d(np.asarray(p, dtype=float))
+    r = np.atleast_2d(np.array(roots, dtype=complex))
+    with np.errstate(all='ignore'):
+        for _ in range(max):
+            f = P[:, :1] + 0*r
+            df = 0*r
+            for i in range(1, P.shape[1]):
+                df = df*r + f
+                f = f*r + P[:, i:i+1]
+            step = np.where(df != 0, f / np.where(df != 0, df, 1), 0)
+            step = np.where(np.isfinite(step), step, 0)
+            r = r - step
+            if np.all(abs(step) <= eps*abs(r)):
+                break
+    return r.reshape(np.shape(roots))
+
+
+def batchRoots(P, eps=10**(-12), max=50, tries=6, polished=False):
+    """Find all roots of many polynomials of the same degree at once.
+
+    Quiet batch version of allRoots. Every row of P is one polynomial and
+    each deflation step runs Bairstow's method on all rows in lockstep,
+    then retries only the rows that hit max from the next seed.
+
+    Parameters
+    ----------
+    P : array_like
+        2-D array of coefficients, one polynomial per row
+        p(x) = ax² + bx + c --> [a,b,c].
+    eps : float, optional
+        Default epsilon value is 10^{-12}.
+    max : int, optional
+        Default maximum iteration count per attempt is 50.
+    tries : int, optional
+        Number of seeds to try for each quadratic factor. Default 6.
+    polished : bool, optional
+        Default to false. When True, polish the roots against P.
+
+    Returns
+    -------
+    roots : ndarray of complex
+        All roots, one row per polynomial.
+    count : ndarray of int
+        Total Bairstow iterations used for each polynomial.
+    converged : ndarray of bool
+        False when every seed for some quadratic factor of that
+        polynomial hit max without its remainder dropping below eps.
+
+    See Also
+    --------
+    allRoots : All roots of a single polynomial.
+    """
+    P = np.asarray(P, dtype=float)
+    a = (P / P[:, :1]).T  # normalize, one column per polynomial
+    m, n = P.shape[0], P.shape[1] - 1
+    roots = np.empty((m, n), dtype=complex)
+    count = np.zeros(m, dtype=int)
+    converged = np.ones(m, dtype=bool)
+    k = 0  # roots found so far
+    with np.errstate(all='ignore'):
+        while len(a) > 3:
+            u, v = seed(a, 0, tries)
+            count += lockstep(a, u, v, eps, max)
+            b = quoGrid(a, u, v)
+            rem = np.maximum(abs(b[-1]), abs(b[-2]))
+            for j in range(1, tries):
+                bad = np.flatnonzero(~(rem <= eps))
+                if bad.size == 0:
+                    break
+                ub, vb = seed(a[:, bad], j, tries)
+                count[bad] += lockstep(a[:, bad], ub, vb, eps, max)
+                b = quoGrid(a[:, bad], ub, vb)
+                better = ~(np.maximum(abs(b[-1]), abs(b[-2])) >= rem[bad])  # keep the best seed
+                u[bad[better]] = ub[better]
+                v[bad[better]] = vb[better]
+                rem[bad[better]] = np.maximum(abs(b[-1]), abs(b[-2]))[better]
+            b = quoGrid(a, u, v)
+            converged &= rem <= eps
+            disc = np.sqrt(u**2 + 4*v + 0j)
+            roots[:, k] = (u + disc)/2
+            roots[:, k+1] = (u - disc)/2
+            k += 2
+            a = b[:-2]
+        if len(a) == 3:  # degree 2
+            disc = np.sqrt(a[1]**2 - 4*a[2] + 0j)
+            roots[:, k] = (-a[1] + disc)/2
+            roots[:, k+1] = (-a[1] - disc)/2
+        else:  # degree 1
+            roots[:, k] = -a[1]
+    if polished:
+        roots = polish(P, roots)
+    return roots, count, converged
+
+def allRoots(p, tries=6, polished=False, trace=None):
     """Find all roots of a polynomial using Bairstow's Method.
 
     Once a quotient is found, solve the quadratic and add to list of roots.
     When degree of polynomial is 2 or less, solve directly and add to list.
+    Each quadratic factor starts from seed and when Bairstow's Method hits
+    its maximum it tries the next seed, keeping the best attempt.
 
     Parameters
     ----------
     p : list of float
         The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c].
+    tries : int, optional
+        Number of seeds to try for each quadratic factor. Default 6.
+    polished : bool, optional
+        Default to false. When True, polish the roots against p.
+    trace : Trace, optional
+        Record each root found, with the remainder of its deflation,
+        instead of printing every step. Default None prints.
 
     Returns
     -------
@@ -178,35 +594,58 @@ def allRoots(p):
         All roots of p(x).
     """
     a = [p[i]/p[0] for i in range(len(p))]  # normalize
-    print("a =", a)
+    show = print if trace is None else lambda *args: None
+    show("a =", a)
     roots = []
+    work = workspace(len(a) - 1)  # shared by every deflation step
     while(len(a) > 3):
-        u = 1
-        v = 1
-        a, u, v = bairstow(a, u, v)
-        print(a)
-        print("u =",u,"v =",v)
+        n = len(a) - 1
+        best = None
+        for k in range(tries):
+            u, v = seed(a, k, tries)
+            q, u, v = bairstow(a, u, v, work=work)
+            rem = max(abs(work[0][n+1]), abs(work[0][n+2]))  # remainder left in workspace
+            if best is None or not rem >= best[0]:
+                best = (rem, q, u, v)
+            if rem <= 10**(-12):
+                break
+        rem, a, u, v = best
+        if not rem <= 10**(-12):
+            print("did not converge, remainder =", rem)
+        show(a)
+        show("u =",u,"v =",v)
         r1, r2 = quadratic(u, v)
-        print("r =",r1,r2)
+        show("r =",r1,r2)
         roots.append(r1)
         roots.append(r2)
+        if trace is not None:
+            trace.record(len(roots) - 1, r1, rem)
+            trace.record(len(roots), r2, rem)
     if(len(a) == 3):  # degree 2
-        print(a)
-        print("u =",-a[1],"v =",-a[2])
+        show(a)
+        show("u =",-a[1],"v =",-a[2])
         r1, r2 = quadratic(-a[1], -a[2])
-        print("r =",r1,r2)
+        show("r =",r1,r2)
         roots.append(r1)
         roots.append(r2)
+        if trace is not None:  # solved directly, no remainder
+            trace.record(len(roots) - 1, r1)
+            trace.record(len(roots), r2)
     else: # degree 1
-        print(a)
-        print("r =",-a[1])
+        show(a)
+        show("r =",-a[1])
         roots.append(-a[1])
-    print("r =", roots)
-    print("p(r) =", [horner(p, r) for r in roots])
+        if trace is not None:
+            trace.record(len(roots), -a[1])
+    if polished:
+        roots = [complex(r) for r in polish(p, roots)]
+    show("r =", roots)
+    show("p(r) =", [horner(p, r) for r in roots])
     return roots
 
 
-def fractal(p, xmin=-3, xmax=3, ymin=-2, ymax=2,):
+def fractal(p, xmin=-3, xmax=3, ymin=-2, ymax=2, width=2000, height=1000, out=None,
+            adaptive=False, cache=None):
     """Create a fractal based on Bairstow's Method.
     
     The horizontalreprestents values for u, while vertical are v values.
@@ -224,20 +663,74 @@ def fractal(p, xmin=-3, xmax=3, ymin=-2, ymax=2,):
         Bottommost number. Default -2.
     vmax : float, optional
         Topmost number. Default 2.
+    width : int, optional
+        Number of u values. Default 2000.
+    height : int, optional
+        Number of v values. Default 1000.
+    out : str, optional
+        When given, render tile by tile over every core into this
+        memory-mapped file (resuming if it was interrupted) and save
+        one pixel per value. Use for 8K/16K renders and deep zooms.
+    adaptive : bool, optional
+        Solve coarse to fine, only near basin boundaries, writing each
+        pass to "BairstowPreview.png". Default False.
+    cache : str, optional
+        Directory of finished tiles reused by later renders with out
+        at the same pixel pitch, for example pans. Default None.
+
+    See Also
+    --------
+    TiledFractal.render : Tiled multi-process renderer.
+    TiledFractal.refine : Coarse to fine renderer.
     """
+    import matplotlib.pyplot as plt  # only needed for drawing
+    import TiledFractal
+    if out is not None:
+        z = TiledFractal.render(partial(bairstowGrid, p), xmin, xmax, ymin, ymax,
+                                width, height, out, cache=cache)
+        TiledFractal.save(z, "BairstowFractal.png")
+        return
+    if adaptive:
+        z, solved = TiledFractal.refine(partial(bairstowGrid, p), xmin, xmax, ymin, ymax,
+                                        width, height, preview="BairstowPreview.png")
+        print("solved", solved, "of", width*height, "pixels")
+        TiledFractal.save(z, "BairstowFractal.png")
+        return
     plt.figure(frameon=False)
     fig, ax = plt.subplots()
     fig.set_size_inches(16, 10.75)
     ax = plt.Axes(fig, [0., 0., 1., 1.])
     ax.set_axis_off()
     fig.add_axes(ax)
-    v, u = np.meshgrid(np.linspace(ymin, ymax, 1000), np.linspace(xmin, xmax, 2000))
-    vbairstow = np.vectorize(bairstow, excluded=['a'])
-    z = vbairstow(a=p, u=u, v=v, count=True)
+    v, u = np.meshgrid(TiledFractal.pixels(ymin, ymax, height), TiledFractal.pixels(xmin, xmax, width))
+    z = bairstowGrid(p, u, v)
     ax.pcolormesh(u, v, z, vmin=z.min(), vmax=z.max(), cmap=plt.get_cmap('ocean'), shading='nearest')
     plt.savefig("BairstowFractal.png", transparent=True)
 
 
+def benchmark(degrees=(8, 32, 128), reps=2000):
+    """Compare the cost of one iteration using quo against quo2.
+
+    One Bairstow iteration used to call quo twice and slice the results.
+    quo2 does both divisions in one pass into a reused workspace.
+
+    Parameters
+    ----------
+    degrees : tuple of int, optional
+        Polynomial degrees to time. Default (8, 32, 128).
+    reps : int, optional
+        Iterations timed per degree. Default 2000.
+    """
+    from timeit import repeat
+    print("degree quo(us) quo2(us) speedup")
+    for n in degrees:
+        a = [1.0/(k + 1) for k in range(n + 1)]
+        b, c = workspace(n)
+        t1 = min(repeat(lambda: quo(quo(a, 0.5, 0.25), 0.5, 0.25)[:-1], number=reps)) / reps
+        t2 = min(repeat(lambda: quo2(a, 0.5, 0.25, b, c), number=reps)) / reps
+        print(n, round(t1*1e6, 2), round(t2*1e6, 2), round(t1/t2, 2))
+
+
 def main():
     """Main Function."""
     allRoots([1, 0, 0, 0, 15, 0, 0, 0, -16])
@@ -246,6 +739,7 @@ def main():
     allRoots([1, -1, 2, 5])
     allRoots([1,20.4,151.3,490,687,719,150,109,6.87])
     fractal([1, 0, 0, 0, 1])
+    # benchmark()  # uncomment to time quo against quo2
 
 
 if __name__ == "__main__":
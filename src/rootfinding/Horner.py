@@ -0,0 +1,162 @@
+"""Vectorized Horner-Ruffini Method.
+
+Evaluates a batch of polynomials over an array of real or complex points
+in one pass, returning p(x), p'(x), and p''(x) together. A compensated
+version built on error-free transformations gives nearly twice the
+working precision along with a running error bound. See Horner.jl for
+the single polynomial version.
+
+@author: Oscar Veliz
+
+Notes
+-----
+.. [1] Graillat, Stef, Philippe Langlois, and Nicolas Louvet. "Compensated
+   Horner scheme." Algebraic and Numerical Algorithms and Symbolic
+   Computation. 2005.
+.. [2] Langlois, Philippe, and Nicolas Louvet. "How to ensure a faithful
+   polynomial evaluation with the compensated Horner algorithm."
+   18th IEEE Symposium on Computer Arithmetic. 2007.
+"""
+import numpy as np
+
+u = np.finfo(float).eps / 2  # unit roundoff
+
+
+def gamma(n):
+    """Higham's constant γ_n = nu/(1-nu) for bounding n roundings."""
+    return n*u / (1 - n*u)
+
+
+def coefficients(P, x):
+    """Shape the coefficients so they broadcast against the points.
+
+    Parameters
+    ----------
+    P : array_like
+        Coefficients [a,b,c] of one polynomial, or a 2-D array with one
+        polynomial per row.
+    x : ndarray
+        The points.
+
+    Returns
+    -------
+    ndarray
+        Coefficient a_i of every polynomial in row i, with trailing axes
+        of length one so that row i broadcasts against x.
+    """
+    P = np.asarray(P)
+    if P.ndim == 1:
+        return P.reshape(P.shape + (1,)*x.ndim)
+    return P.T.reshape((P.shape[1], P.shape[0]) + (1,)*x.ndim)
+
+
+def evaluate(P, x):
+    """Evaluate polynomials and their first two derivatives with Horner.
+
+    p(x) = ax² + bx + c --> ((a)x + b)x + c, with p'(x) and p''(x)
+    accumulated in the same pass.
+
+    Parameters
+    ----------
+    P : array_like
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c], or a
+        2-D array with one polynomial per row.
+    x : array_like of float or complex
+        The points to evaluate at.
+
+    Returns
+    -------
+    tuple of three ndarray
+        p(x), p'(x), and p''(x). Shaped like x, with a leading axis over
+        the polynomials when P is 2-D.
+    """
+    x = np.asarray(x)
+    a = coefficients(P, x)
+    p = a[0] * np.ones_like(x)
+    dp = np.zeros_like(p)
+    ddp = np.zeros_like(p)
+    for i in range(1, len(a)):
+        ddp = ddp*x + dp
+        dp = dp*x + p
+        p = p*x + a[i]
+    return p, dp, 2*ddp
+
+
+def twoSum(a, b):
+    """Error-free sum a + b = s + e (Knuth)."""
+    s = a + b
+    z = s - a
+    return s, (a - (s - z)) + (b - z)
+
+
+def split(a):
+    """Split a into high and low halves with 26 bits each (Dekker)."""
+    c = 134217729.0 * a  # 2^27 + 1
+    h = c - (c - a)
+    return h, a - h
+
+
+def twoProduct(a, b):
+    """Error-free product a * b = p + e (Dekker)."""
+    p = a * b
+    ah, al = split(a)
+    bh, bl = split(b)
+    return p, al*bl - (((p - ah*bh) - al*bh) - ah*bl)
+
+
+def compensated(P, x):
+    """Compensated Horner evaluation with a running error bound.
+
+    Each step of Horner is made error-free with twoProduct and twoSum and
+    the lost parts are evaluated as a second polynomial which corrects
+    the result. The result is as accurate as if computed in twice the
+    working precision. Only real points are supported.
+
+    Parameters
+    ----------
+    P : array_like of float
+        The polynomial coefficients p(x) = ax² + bx + c --> [a,b,c], or a
+        2-D array with one polynomial per row.
+    x : array_like of float
+        The points to evaluate at.
+
+    Returns
+    -------
+    tuple of two ndarray
+        p(x) and a bound on |computed - exact| at each point.
+    """
+    x = np.asarray(x, dtype=float)
+    a = coefficients(np.asarray(P, dtype=float), x)
+    n = len(a) - 1
+    ax = abs(x)
+    s = a[0] * np.ones_like(x)
+    c = np.zeros_like(s)  # Horner of the rounding errors
+    e = np.zeros_like(s)  # Horner of their magnitudes at |x|
+    for i in range(1, len(a)):
+        p, pi = twoProduct(s, x)
+        s, sigma = twoSum(p, a[i])
+        c = c*x + (pi + sigma)
+        e = e*ax + (abs(pi) + abs(sigma))
+    r = s + c
+    alpha = (gamma(4*n + 2)*e + 2*u**2*abs(r)) / (1 - 2*(n + 1)*u)
+    return r, (u*abs(r) + alpha) / (1 - 2*u)
+
+
+def main():
+    """Compare plain and compensated Horner near a multiple root."""
+    P = np.poly(np.full(7, 2.0))  # (x-2)^7, badly conditioned near 2
+    x = np.linspace(1.99, 2.01, 5)
+    exact = (x - 2)**7
+    p, dp, ddp = evaluate(P, x)
+    r, bound = compensated(P, x)
+    print("x", x)
+    print("exact", exact)
+    print("horner", p)
+    print("compensated", r)
+    print("error", abs(r - exact))
+    print("bound", bound)
+    print("batch", evaluate([[1, 0, -1], [1, 0, 1]], np.array([1j, 2.0]))[0])
+
+
+if __name__ == "__main__":
+    main()
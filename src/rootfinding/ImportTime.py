@@ -0,0 +1,63 @@
+"""Import Time Benchmark.
+
+Times importing each solver in a fresh interpreter and checks that
+matplotlib and SymPy are not loaded until a plotting or symbolic function
+is called. Exits with status 1 if any solver pulls them in at import, so
+it can guard against the heavy imports coming back.
+
+@author: Oscar Veliz
+"""
+import os
+import subprocess
+import sys
+
+here = os.path.dirname(os.path.abspath(__file__))
+solvers = [(here, "Bairstow"),
+           (here, "JenkinsTraub"),
+           (os.path.join(here, "..", "systems"), "GeneralizedBisection")]
+heavy = ["matplotlib", "sympy"]
+
+
+def timeImport(directory, stmt):
+    """Run import statements in a fresh interpreter.
+
+    Parameters
+    ----------
+    directory : str
+        Working directory, so sibling modules import.
+    stmt : str
+        The import statements.
+
+    Returns
+    -------
+    tuple
+        Seconds taken and list of heavy modules left in sys.modules.
+    """
+    code = ("import sys, time\n"
+            "t = time.perf_counter()\n"
+            + stmt + "\n"
+            "t = time.perf_counter() - t\n"
+            "print(t, *[m for m in %r if m in sys.modules])" % heavy)
+    out = subprocess.run([sys.executable, "-c", code], cwd=directory,
+                         capture_output=True, text=True, check=True).stdout.split()
+    return float(out[0]), out[1:]
+
+
+def main():
+    """Time each solver import against importing the heavy dependencies."""
+    base, _ = timeImport(here, "import numpy")
+    full, _ = timeImport(here, "import numpy, matplotlib.pyplot, sympy")
+    print("numpy alone", round(base, 3), "s")
+    print("numpy, matplotlib, sympy", round(full, 3), "s")
+    failed = False
+    for directory, name in solvers:
+        t, loaded = timeImport(directory, "import " + name)
+        print(name, round(t, 3), "s", "loaded " + ", ".join(loaded) if loaded else "")
+        failed = failed or bool(loaded)
+    if failed:
+        print("heavy dependency imported at module level")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
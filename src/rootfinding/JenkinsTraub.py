@@ -1,12 +1,17 @@
-from sympy import Poly, symbols, div, I, nan, zoo
+from __future__ import annotations  # Poly annotations without importing SymPy
+from functools import lru_cache, partial
 import numpy as np
-import matplotlib.pyplot as plt
-
-x = symbols('x')
 
 """
 Implementation of Traub's and simplified Jenkins-Traub algorithms
 
+Polynomials are stored as NumPy complex128 coefficient arrays [a,b,c]
+for p(x) = ax² + bx + c, made monic, and H is shifted by synthetic
+division. The public functions also accept a SymPy Poly. SymPy and
+matplotlib are only imported by the functions that need them.
+Coefficient arrays and compiled evaluators of P are kept in bounded LRU
+caches keyed by coefficients so repeated runs on the same P reuse them.
+
 Author
 ------
 Oscar Veliz
@@ -14,82 +19,353 @@ Date: 2024-07-25
 Version: 1.0
 """
 
+CACHE_SIZE = 256  # entries per cache, see cacheInfo
+
 
-def compute_G(P: Poly, n=10):
+def coeffs(P):
     """
-    Computes Traub's largest root finder using G polynomial.
+    Converts a polynomial to a monic complex128 coefficient array.
+
+    Parameters
+    ----------
+    P : Poly or array_like
+        The input polynomial as a SymPy Poly or coefficients [a,b,c].
+
+    Returns
+    -------
+    ndarray
+        Coefficients divided by the leading coefficient.
+    """
+    if hasattr(P, 'all_coeffs'):  # SymPy Poly
+        return polyCoeffs(P)
+    p = np.array(P, dtype=complex)
+    return p / p[0]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def polyCoeffs(P: Poly):
+    """
+    Converts a SymPy Poly to monic coefficients, cached since it is slow.
 
     Parameters
     ----------
     P : Poly
         The input polynomial.
+
+    Returns
+    -------
+    ndarray
+        Read-only coefficients divided by the leading coefficient.
+    """
+    p = np.array([complex(c) for c in P.all_coeffs()])
+    p = p / p[0]
+    p.flags.writeable = False
+    return p
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compiled(key: bytes):
+    """
+    Builds a Horner evaluator for the polynomial whose coefficients are key.
+
+    Parameters
+    ----------
+    key : bytes
+        The complex128 coefficients as bytes.
+
+    Returns
+    -------
+    function
+        f(s) = p(s) using Python complex arithmetic.
+    """
+    head, *tail = np.frombuffer(key, dtype=complex).tolist()
+
+    def f(s):
+        r = head
+        for c in tail:
+            r = r*s + c
+        return r
+    return f
+
+
+def evaluator(p: np.ndarray):
+    """
+    Looks up the compiled evaluator of p in the cache.
+
+    Parameters
+    ----------
+    p : ndarray
+        The polynomial coefficients.
+
+    Returns
+    -------
+    function
+        f(s) = p(s).
+    """
+    return compiled(np.asarray(p, dtype=complex).tobytes())
+
+
+def cacheInfo():
+    """
+    Reports hits and misses of each cache, to help choose CACHE_SIZE.
+
+    Returns
+    -------
+    dict
+        Cache name to functools CacheInfo(hits, misses, maxsize, currsize).
+    """
+    return {"coeffs": polyCoeffs.cache_info(),
+            "evaluators": compiled.cache_info()}
+
+
+def cacheClear():
+    """
+    Empties every cache and resets its statistics.
+    """
+    polyCoeffs.cache_clear()
+    compiled.cache_clear()
+
+
+def result(s):
+    """
+    Converts a numeric root to float when it is real.
+
+    Parameters
+    ----------
+    s : complex
+        The root.
+
+    Returns
+    -------
+    float or complex
+        The root.
+    """
+    s = complex(s)
+    return s.real if s.imag == 0 else s
+
+
+def evaluate(p: np.ndarray, s):
+    """
+    Evaluates p(s) using Horner's method.
+
+    Parameters
+    ----------
+    p : ndarray
+        The polynomial coefficients, or one column of coefficients per point.
+    s : complex or ndarray
+        The point or points to evaluate at.
+
+    Returns
+    -------
+    complex or ndarray
+        The value p(s).
+    """
+    r = p[0]
+    for c in p[1:]:
+        r = r*s + c
+    return r
+
+
+def synthetic(p: np.ndarray, s):
+    """
+    Divides p by (x - s) using synthetic division.
+
+    Parameters
+    ----------
+    p : ndarray
+        The polynomial coefficients, or one column of coefficients per point.
+    s : complex or ndarray
+        The root of the linear divisor, or one root per point.
+
+    Returns
+    -------
+    tuple
+        The quotient coefficients and the remainder p(s). For many points
+        the quotient has one column per point.
+    """
+    q = np.empty((len(p) - 1,) + np.broadcast(p[0], s).shape, dtype=complex)
+    r = p[0]
+    for i in range(1, len(p)):
+        q[i-1] = r
+        r = r*s + p[i]
+    return q, r
+
+
+def derivative(p: np.ndarray):
+    """
+    Computes the coefficients of p'(x).
+
+    Parameters
+    ----------
+    p : ndarray
+        The polynomial coefficients.
+
+    Returns
+    -------
+    ndarray
+        The derivative coefficients.
+    """
+    n = len(p) - 1
+    return p[:-1] * np.arange(n, 0, -1)
+
+
+def sequenceG(P: np.ndarray):
+    """
+    Yields Traub's G polynomials G_0 = P' and G_{k+1} = x*G_k - lc(G_k)*P one at a time.
+
+    Parameters
+    ----------
+    P : ndarray
+        The monic input polynomial coefficients.
+
+    Yields
+    ------
+    ndarray
+        The next polynomial G. Only the current one is kept.
+    """
+    G = derivative(P)
+    while True:
+        yield G
+        G = (np.append(G, 0) - G[0] * P)[1:]  # x*G - lc*P, leading terms cancel
+
+
+def settled(old: np.ndarray, new: np.ndarray, tol):
+    """
+    Checks whether a normalized polynomial has stopped changing.
+
+    Parameters
+    ----------
+    old : ndarray
+        The previous polynomial, or None.
+    new : ndarray
+        The current polynomial.
+    tol : float
+        The relative tolerance.
+
+    Returns
+    -------
+    bool
+        True when normH(new) is within tol of normH(old).
+    """
+    if old is None:
+        return False
+    with np.errstate(all='ignore'):  # a zero leading coefficient never settles
+        new = normH(new)
+        return np.max(abs(new - normH(old))) <= tol * np.max(abs(new))
+
+
+def compute_G(P: np.ndarray, n=10, tol=10**-12):
+    """
+    Computes Traub's largest root finder using G polynomial.
+
+    Stops after n iterations or as soon as normalized G stops changing.
+
+    Parameters
+    ----------
+    P : ndarray
+        The monic input polynomial coefficients.
     n : int, optional
-        The number of iterations to perform (default is 10).
+        The maximum number of iterations to perform (default is 10).
+    tol : float, optional
+        The relative change in normalized G to stop at (default is 10^-12).
 
     Returns
     -------
-    Poly
-        The polynomial G after n iterations
+    ndarray
+        The final polynomial G
     """
-    G = [P.diff(x)]
-    for _ in range(n):
-        lc = G[-1].LC()
-        G_next = x * G[-1] - lc * P
-        G.append(G_next)
-    # print(G) # uncomment to see all G
-    return G[-1]
+    previous = None
+    for k, G in enumerate(sequenceG(P)):
+        # print(G) # uncomment to see each G
+        if k == n or settled(previous, G, tol):
+            return G
+        previous = G
 
 
-def shift(P: Poly, H: Poly, s=0):
+def shift(P: np.ndarray, H: np.ndarray, s=0):
     """
-    Shifts a polynomial H by evaluating it at a shift point s using polynomial division.
+    Shifts a polynomial H by evaluating it at a shift point s using synthetic division.
+
+    Since P(x) = (x-s)Q_P(x) + P(s) and H(x) = (x-s)Q_H(x) + H(s),
+
+    (H - P*H(s)/P(s)) / (x-s) = Q_H - Q_P*H(s)/P(s)
 
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
-    H : Poly
+    P : ndarray
+        The monic input polynomial coefficients.
+    H : ndarray
         The polynomial to be shifted.
     s : float, optional
         The shift point (default is 0).
 
     Returns
     -------
-    Poly
+    ndarray
         The shifted H.
     """
-    Ps = P.eval(s).evalf()
-    Hs = H.eval(s).evalf()
-    result, _ = div(H-P*Hs/Ps, x-s)
+    QP, Ps = synthetic(P, s)
+    QH, Hs = synthetic(H, s)
+    result = -(Hs/Ps) * QP
+    result[1:] += QH
     return result
 
 
-def compute_H(P: Poly, n=10, s=0):
+def sequenceH(P: np.ndarray, H: np.ndarray = None, s=0):
+    """
+    Yields Traub's H polynomials, each the shift of the one before, one at a time.
+
+    Parameters
+    ----------
+    P : ndarray
+        The monic input polynomial coefficients.
+    H : ndarray, optional
+        The first H (default is P').
+    s : float, optional
+        The shift point (default is 0).
+
+    Yields
+    ------
+    ndarray
+        The next polynomial H. Only the current one is kept.
+    """
+    H = derivative(P) if H is None else H
+    while True:
+        yield H
+        H = shift(P, H, s)
+
+
+def compute_H(P: np.ndarray, n=10, s=0, tol=10**-12):
     """
     Computes Traub's H polynomial.
 
+    Stops after n iterations or as soon as normalized H stops changing.
+
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
+    P : ndarray
+        The monic input polynomial coefficients.
     n : int, optional
-        The number of iterations to perform (default is 10).
+        The maximum number of iterations to perform (default is 10).
     s : float, optional
         The shift point for evaluating H (default is 0).
+    tol : float, optional
+        The relative change in normalized H to stop at (default is 10^-12).
 
     Returns
     -------
-    Poly
-        The polynomial H after n iterations.
+    ndarray
+        The final polynomial H.
     """
-    H = [P.diff(x)]
-    for _ in range(n):
-        H.append(shift(P, H[-1], s))
-    # print(H) # uncomment to see all H
-    return H[-1]
+    previous = None
+    for k, H in enumerate(sequenceH(P, s=s)):
+        # print(H) # uncomment to see each H
+        if k == n or settled(previous, H, tol):
+            return H
+        previous = H
 
 
-def runner(P: Poly, GH: Poly, s=1.1, eps=10**-7):
+def runner(P: np.ndarray, GH: np.ndarray, s=1.1, eps=10**-7):
     """
     Runs Traub's method for given P and either a G or H poly at a given point s.
 
@@ -97,9 +373,9 @@ def runner(P: Poly, GH: Poly, s=1.1, eps=10**-7):
 
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
-    GH : Poly
+    P : ndarray
+        The monic input polynomial coefficients.
+    GH : ndarray
         G or H polynomial.
     s : float, optional
         The starting point for root finding (default is 1.1).
@@ -111,19 +387,23 @@ def runner(P: Poly, GH: Poly, s=1.1, eps=10**-7):
     float
         The approximated root of the polynomial.
     """
-    Px = P.eval(s).evalf()
-    GHx = GH.eval(s).evalf()
-    lc = GH.LC()
+    s = complex(s)
+    Pf = evaluator(P)
+    GHf = evaluator(GH)
+    Px = Pf(s)
+    GHx = GHf(s)
+    lc = GH[0]
     i = 0
-    while abs(Px) > eps and i < 50 and GHx != nan and GHx != zoo and Px != nan and Px != zoo:
-        s = s - Px / (GHx / lc)
-        Px = P.eval(s).evalf()
-        GHx = GH.eval(s).evalf()
-        i += 1
-        # print("s",s) # uncomment to see iterations
+    with np.errstate(all='ignore'):
+        while abs(Px) > eps and i < 50 and np.isfinite(GHx) and np.isfinite(Px):
+            s = s - Px / (GHx / lc)
+            Px = Pf(s)
+            GHx = GHf(s)
+            i += 1
+            # print("s",s) # uncomment to see iterations
     if i == 50:
-        return nan
-    return s.evalf()
+        return float('nan')
+    return result(s)
 
 
 def traub1(P: Poly, x=1, L=10, eps=10**-7):
@@ -132,8 +412,8 @@ def traub1(P: Poly, x=1, L=10, eps=10**-7):
 
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
+    P : Poly or array_like
+        The input polynomial or its coefficients.
     x : float, optional
         The starting point for root finding (default is 1).
     L : int, optional
@@ -146,6 +426,7 @@ def traub1(P: Poly, x=1, L=10, eps=10**-7):
     float
         The approximated largest root of the polynomial.
     """
+    P = coeffs(P)
     G = compute_G(P, L)
     return runner(P, G, x, eps)
 
@@ -156,8 +437,8 @@ def traub2(P: Poly, x=0, L=10, eps=10**-7):
 
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
+    P : Poly or array_like
+        The input polynomial or its coefficients.
     x : float, optional
         The starting point for root finding (default is 0). To see what JenkinsTraub
         would do with a fixed shift stage 2, replace the default x value.
@@ -171,52 +452,61 @@ def traub2(P: Poly, x=0, L=10, eps=10**-7):
     float
         The approximated smallest root of the polynomial.
     """
+    P = coeffs(P)
     H = compute_H(P, n=L)
     return runner(P, H, x, eps)
 
 
-def stage2(P: Poly, H: Poly, s: float, M=5):
+def stage2(P: np.ndarray, H: np.ndarray, s: float, M=5, tol=10**-12):
     """
     Performs Stage 2 of the Jenkins-Traub method.
 
+    Stops after M shifts or as soon as the root estimate s - P(s)/HBar(s)
+    stops changing.
+
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
-    H : Poly
+    P : ndarray
+        The monic input polynomial coefficients.
+    H : ndarray
         The polynomial from Stage 1.
     s : float
         The shift value s.
     M : int, optional
-        The number of iterations (default is 5).
+        The maximum number of iterations (default is 5).
+    tol : float, optional
+        The relative change in the root estimate to stop at (default is 10^-12).
 
     Returns
     -------
-    Poly
+    ndarray
         The updated H polynomial.
     """
-    H = [H]
-    for _ in range(M):
-        Hx = H[-1]
-        Hs = Hx.eval(s).evalf()
-        if Hs == nan or Hs == zoo:
-            H.pop()
-            break
-        H_next = shift(P, H[-1], s)
-        H.append(H_next)
-    # print("stage 2 H", H)  # uncomment to see all H
-    return H[-1]
+    Ps = evaluator(P)(s)
+    previous = None
+    t = None
+    for k, Hx in enumerate(sequenceH(P, H, s)):
+        # print("stage 2 H", Hx)  # uncomment to see each H
+        if k == M:
+            return Hx
+        Hs = evaluate(Hx, s)
+        if not np.isfinite(Hs):
+            return Hx if previous is None else previous
+        t_next = s - Ps / (Hs / Hx[0])
+        if t is not None and abs(t_next - t) <= tol * abs(t_next):
+            return Hx
+        previous, t = Hx, t_next
 
 
-def stage3(P: Poly, H: Poly, s: float, withCount=False, eps=10**-7):
+def stage3(P: np.ndarray, H: np.ndarray, s: float, withCount=False, eps=10**-7):
     """
     Performs Stage 3 of the Jenkins-Traub method.
 
     Parameters
     ----------
-    P : Poly
-        The input polynomial.
-    H : Poly
+    P : ndarray
+        The monic input polynomial coefficients.
+    H : ndarray
         The polynomial from Stage 2.
     s : float
         The initial guess.
@@ -230,39 +520,40 @@ def stage3(P: Poly, H: Poly, s: float, withCount=False, eps=10**-7):
     float
         The final approximated root of the polynomial, or the number of iterations if withCount is True.
     """
-    H = [H]
-    Ps = P.eval(s).evalf()
-    HBar = normH(H[-1])
-    HBs = HBar.eval(s).evalf()
+    Pf = evaluator(P)
+    Ps = Pf(s)
+    HBar = normH(H)
+    HBs = evaluate(HBar, s)
     s = s - Ps/HBs
     i = 0
     while abs(Ps) > eps and i < 25:
-        H_next = shift(P, H[-1], s)
-        HBar = normH(H[-1])
-        HBs = HBar.eval(s).evalf()
+        H_next = shift(P, H, s)
+        HBar = normH(H)
+        HBs = evaluate(HBar, s)
         s = s - Ps/HBs
-        Ps = P.eval(s).evalf()
-        H.append(H_next)
+        Ps = Pf(s)
+        H = H_next  # only the current H is kept
+        # print("stage 3 H", H) # uncomment to see each H
         i += 1
-    # print("stage 3 H", H) # uncomment to see all H
-    return i if withCount else s.evalf()
+    return i if withCount else result(s)
 
 
-def normH(p: Poly):
+def normH(p: np.ndarray):
     """
     Normalizes the polynomial p by dividing by its leading coefficient.
 
     Parameters
     ----------
-    p : Poly
+    p : ndarray
         The polynomial to be normalized.
 
     Returns
     -------
-    Poly
+    ndarray
         The normalized polynomial.
     """
-    return 1/p.LC() * p  # if used p/p.LC() it would need to be cast as a Poly
+    p = np.asarray(p, dtype=complex)
+    return p / p[0]  # H changes every iteration, so caching it never pays
 
 
 def simpleJK(P: Poly, s=1.1, withCount=False):
@@ -272,6 +563,347 @@ def simpleJK(P: Poly, s=1.1, withCount=False):
     This method includes a basic Stage 1 but not including the convoluted way
     of approximating a good s value via Cauchy's beta method.
 
+    Parameters
+    ----------
+    P : Poly or array_like
+        The input polynomial or its coefficients.
+    s : float, optional
+        The starting point for root finding (default is 1.1).
+    withCount : bool, optional
+        If True, returns the number of iterations instead of the root (default is False).
+
+    Returns
+    -------
+    float
+        The approximated root of the polynomial, or the number of iterations if withCount is True.
+
+    Notes
+    -----
+    Runs simpleJKGrid on a single point, so a count is exactly the pixel of
+    the batched fractal. stage2 and stage3 do the same steps in scalar
+    arithmetic, which rounds differently and can change the count on
+    chaotic starting points.
+    """
+    count, root = simpleJKGrid(P, [s], withRoots=True)
+    return int(count[0]) if withCount else result(root[0])
+
+
+def simpleJKGrid(P: Poly, S, eps=10**-7, block=2**16, withRoots=False):
+    """
+    Counts simplified Jenkins-Traub iterations for many starting points at once.
+
+    The iteration behind simpleJK(P, s, withCount=True), run on complex
+    arrays in lockstep, one column of H per starting point. Points whose
+    P(s) is within eps drop out of the active set, so each pass only works
+    on the pixels still iterating. Points are handled block at a time to
+    bound memory.
+
+    Parameters
+    ----------
+    P : Poly or array_like
+        The input polynomial or its coefficients.
+    S : array_like of complex
+        The starting points.
+    eps : float, optional
+        The convergence tolerance (default is 10^-7).
+    block : int, optional
+        Number of points processed together (default is 2^16).
+    withRoots : bool, optional
+        If True, also returns the final s of every point (default is False).
+
+    Returns
+    -------
+    ndarray or tuple
+        Number of stage 3 iterations for each starting point, shaped like S,
+        and the roots shaped like S when withRoots is True.
+    """
+    P = coeffs(P)
+    S = np.asarray(S, dtype=complex)
+    count = np.zeros(S.size, dtype=int)
+    roots = np.empty(S.size, dtype=complex)
+    H0 = derivative(P)  # basic stage 1
+    with np.errstate(all='ignore'):  # a shift landing on a root gives inf/nan
+        for b in range(0, S.size, block):
+            s = S.ravel()[b:b+block].copy()
+            # stage 2 with M = 1 is a single shift, unless H0(s) overflows
+            H = shift(P, H0, s)
+            H = np.where(np.isfinite(evaluate(H0, s)), H, H0[:, None])
+            # stage 3
+            Ps = evaluate(P, s)
+            s = s - Ps / evaluate(H / H[0], s)
+            active = np.arange(s.size)
+            for _ in range(25):
+                active = active[abs(Ps[active]) > eps]  # nan drops out as well
+                if active.size == 0:
+                    break
+                Ha, sa = H[:, active], s[active]
+                H[:, active] = shift(P, Ha, sa)
+                sa = sa - Ps[active] / evaluate(Ha / Ha[0], sa)  # stale P(s) as in stage3
+                s[active] = sa
+                Ps[active] = evaluate(P, sa)
+                count[b + active] += 1
+            roots[b:b+block] = s
+    if withRoots:
+        return count.reshape(S.shape), roots.reshape(S.shape)
+    return count.reshape(S.shape)
+
+
+def cauchy(P: np.ndarray):
+    """
+    Computes Cauchy's lower bound β on the moduli of the roots of P.
+
+    β is the positive root of |a_0|x^n + ... + |a_{n-1}|x - |a_n|, found by
+    Newton's method from (|a_n|/|a_0|)^{1/n} which is never below it.
+
+    Parameters
+    ----------
+    P : ndarray
+        The polynomial coefficients with P(0) != 0.
+
+    Returns
+    -------
+    float
+        The lower bound β.
+    """
+    q = abs(P)
+    q[-1] = -q[-1]
+    n = len(q) - 1
+    dq = derivative(q)
+    b = (-q[-1] / q[0])**(1/n)
+    for _ in range(100):
+        step = evaluate(q, b) / evaluate(dq, b)
+        b -= step
+        if step <= 10**-3 * b:
+            break
+    return b
+
+
+def scale(H: np.ndarray):
+    """
+    Scales H so its largest coefficient has modulus one, avoiding overflow.
+
+    Parameters
+    ----------
+    H : ndarray
+        The polynomial coefficients.
+
+    Returns
+    -------
+    ndarray
+        The scaled polynomial.
+    """
+    m = abs(H).max()
+    return H / m if m > 0 else H
+
+
+def bound(P: np.ndarray, s):
+    """
+    Bounds the rounding error made evaluating P(s) with Horner's method.
+
+    Parameters
+    ----------
+    P : ndarray
+        The polynomial coefficients.
+    s : complex
+        The point P was evaluated at.
+
+    Returns
+    -------
+    float
+        |P(s)| below this value is indistinguishable from zero.
+    """
+    n = len(P) - 1
+    return 4*n*np.finfo(float).eps * evaluate(abs(P), abs(s)).real
+
+
+def fixedShift(P: np.ndarray, H: np.ndarray, s, L=20):
+    """
+    Performs Stage 2 of the Jenkins-Traub method with its convergence test.
+
+    With t = s - P(s)/HBar(s), Stage 2 stops once two successive steps
+    satisfy |t_{λ+1} - t_λ| <= |t_λ|/2, meaning H has picked out the
+    root closest to s.
+
+    Parameters
+    ----------
+    P : ndarray
+        The monic input polynomial coefficients.
+    H : ndarray
+        The polynomial from Stage 1.
+    s : complex
+        The fixed shift.
+    L : int, optional
+        The maximum number of iterations (default is 20).
+
+    Returns
+    -------
+    tuple
+        The updated H and the estimate t, or None for t when the test
+        never passed.
+    """
+    Ps = evaluator(P)(s)
+    t = None
+    passed = 0
+    for _ in range(L):
+        H = scale(shift(P, H, s))
+        if H[0] == 0 or not np.all(np.isfinite(H)):
+            return H, None
+        t_next = s - Ps / evaluate(normH(H), s)
+        if t is not None and abs(t_next - t) <= 0.5*abs(t):
+            passed += 1
+        else:
+            passed = 0
+        t = t_next
+        if passed == 2:
+            return H, t
+    return H, None
+
+
+def variableShift(P: np.ndarray, H: np.ndarray, s, L=20):
+    """
+    Performs Stage 3 of the Jenkins-Traub method until P(s) is at rounding level.
+
+    Parameters
+    ----------
+    P : ndarray
+        The monic input polynomial coefficients.
+    H : ndarray
+        The polynomial from Stage 2.
+    s : complex
+        The estimate from Stage 2.
+    L : int, optional
+        The maximum number of iterations (default is 20).
+
+    Returns
+    -------
+    tuple
+        The final s and |P(s)| relative to its rounding error bound, which
+        is at most one when s has converged.
+    """
+    Pf = evaluator(P)
+    for _ in range(L):
+        Ps = Pf(s)
+        err = abs(Ps) / bound(P, s)
+        if err <= 1:
+            break
+        H = scale(shift(P, H, s))
+        HBs = evaluate(normH(H), s)
+        if HBs == 0 or not np.isfinite(HBs):
+            break
+        s = s - Ps / HBs
+    else:
+        err = abs(Pf(s)) / bound(P, s)
+    return s, err
+
+
+def polishRoot(P: np.ndarray, dP: np.ndarray, s, steps=3):
+    """
+    Polishes a root with Newton's method against the original polynomial.
+
+    Roots found after deflation carry the rounding error of every earlier
+    deflation, which a few Newton steps on the original P remove.
+
+    Parameters
+    ----------
+    P : ndarray
+        The original polynomial coefficients.
+    dP : ndarray
+        The coefficients of P'.
+    s : complex
+        The root to polish.
+    steps : int, optional
+        The maximum number of Newton steps (default is 3).
+
+    Returns
+    -------
+    complex
+        The polished root.
+    """
+    Pf = evaluator(P)
+    dPf = evaluator(dP)
+    Ps = Pf(s)
+    for _ in range(steps):
+        dPs = dPf(s)
+        if dPs == 0 or not np.isfinite(dPs):
+            break
+        s_next = s - Ps / dPs
+        Ps_next = Pf(s_next)
+        if not abs(Ps_next) < abs(Ps):  # only keep steps that help, near multiple roots they do not
+            break
+        s, Ps = s_next, Ps_next
+    return s
+
+
+def jenkinsTraub(P: Poly, M=5, L=20, tries=20):
+    """
+    Finds all roots of a polynomial with the three stage Jenkins-Traub method.
+
+    Stage 1 runs M no-shift steps. Stage 2 uses the shift s = βe^{iθ} where β
+    is Cauchy's lower bound, so s is no larger than the smallest root, and θ
+    starts at 49° and turns 94° whenever Stage 2 or 3 fails. Each root is
+    polished against the original P and then deflated out of P by
+    synthetic division before finding the next. Deflation still loses
+    accuracy for high degree polynomials with many roots near one circle.
+
+    Parameters
+    ----------
+    P : Poly or array_like
+        The input polynomial or its coefficients.
+    M : int, optional
+        The number of Stage 1 steps (default is 5).
+    L : int, optional
+        The maximum number of Stage 2 and Stage 3 steps (default is 20).
+    tries : int, optional
+        The number of shifts to try for each root (default is 20). If every
+        try fails, the best estimate found is used.
+
+    Returns
+    -------
+    ndarray
+        All roots of the polynomial, smallest modulus first.
+    """
+    p = coeffs(P)
+    P0 = p
+    dP0 = derivative(p)
+    roots = []
+    while len(p) > 1 and p[-1] == 0:  # zero roots
+        roots.append(0j)
+        p = p[:-1]
+    theta = 49 * np.pi/180
+    with np.errstate(all='ignore'):
+        while len(p) > 2:
+            H = derivative(p)
+            for _ in range(M):  # stage 1, no shift
+                H = scale(shift(p, H, 0))
+            beta = cauchy(p)
+            best = (np.inf, 0j)
+            for _ in range(tries):
+                s = beta * np.exp(1j*theta)
+                H2, t = fixedShift(p, H, s, L)
+                if t is not None:
+                    root, err = variableShift(p, H2, t, L)
+                    if err < best[0]:
+                        best = (err, root)
+                    if err <= 1:
+                        break
+                theta += 94 * np.pi/180
+            if best[0] == np.inf:  # stage 2 never passed, go with the last shift
+                best = variableShift(p, H2, s, L)[::-1]
+            root = polishRoot(P0, dP0, best[1])
+            roots.append(root)
+            p = synthetic(p, root)[0]
+    if len(p) == 2:
+        roots.append(-p[1] / p[0])
+    roots = np.array(roots, dtype=complex)
+    return roots[np.argsort(abs(roots), kind='stable')]  # the shifts can reach a larger root first
+
+
+def sympyJK(P: Poly, s=1.1, withCount=False):
+    """
+    The original SymPy version of simpleJK, kept to benchmark against.
+
+    Every step is a symbolic polynomial division.
+
     Parameters
     ----------
     P : Poly
@@ -286,15 +918,79 @@ def simpleJK(P: Poly, s=1.1, withCount=False):
     float
         The approximated root of the polynomial, or the number of iterations if withCount is True.
     """
-    H = [P.diff(x)]  # basic stage 1
-    # H = [compute_H(P,3)] # towards smallest stage 1
-    # print("stage 1 H", H[-1])  # uncomment to see stage 1
-    Hx = stage2(P, H[-1], s, 1)
-    # print("stage 2 H", Hx)  # uncomment to see stage 2
-    return stage3(P, Hx, s, withCount)
+    from sympy import div
+    x = P.gens[0]
+
+    def symshift(H, s):
+        result, _ = div(H - P*H.eval(s).evalf()/P.eval(s).evalf(), x - s)
+        return result
+    H = symshift(P.diff(x), s)  # stage 1 and one step of stage 2
+    Ps = P.eval(s).evalf()
+    s = s - Ps/(1/H.LC()*H).eval(s).evalf()
+    i = 0
+    while abs(Ps) > 10**-7 and i < 25:
+        H_next = symshift(H, s)
+        s = s - Ps/(1/H.LC()*H).eval(s).evalf()
+        Ps = P.eval(s).evalf()
+        H = H_next
+        i += 1
+    return i if withCount else s.evalf()
+
+
+def benchmark(P: Poly = None, s=4.1, reps=20):
+    """
+    Times simpleJK against the original SymPy version.
+
+    Parameters
+    ----------
+    P : Poly, optional
+        The input polynomial (default is the one from main).
+    s : float, optional
+        The starting point for root finding (default is 4.1).
+    reps : int, optional
+        Number of runs timed (default is 20).
+    """
+    from timeit import timeit
+    if P is None:
+        from sympy import Poly, symbols
+        x = symbols('x')
+        P = Poly(x**5 - 8*x**4 - 72*x**3 + 382*x**2 + 727*x - 2310)
+    print("numpy", simpleJK(P, s), "sympy", sympyJK(P, s))
+    t1 = timeit(lambda: sympyJK(P, s), number=reps) / reps
+    t2 = timeit(lambda: simpleJK(P, s), number=reps) / reps
+    print("sympy(ms)", round(t1*1e3, 3), "numpy(ms)", round(t2*1e3, 3), "speedup", round(t1/t2, 1))
+
+
+def countGrid(P: Poly, X, Y, batched=True):
+    """
+    Counts simplified Jenkins-Traub iterations over a grid of starting points.
+
+    Parameters
+    ----------
+    P : Poly
+        The input polynomial.
+    X : ndarray
+        Real parts of the starting points.
+    Y : ndarray
+        Imaginary parts of the starting points.
+    batched : bool, optional
+        Iterate every point in lockstep with simpleJKGrid (default is True)
+        rather than calling simpleJK once per point.
+
+    Returns
+    -------
+    ndarray
+        Number of iterations for each starting point X + Y*i.
+    """
+    P = coeffs(P)
+    if batched:
+        return simpleJKGrid(P, X + Y * 1j)
+    vjk = np.vectorize(lambda s: simpleJK(P, s, withCount=True), otypes=[int])
+    return vjk(X + Y * 1j)
 
 
-def fractal(P: Poly, xmin=-3, xmax=3, ymin=-1.69, ymax=1.69):
+def fractal(P: Poly, xmin=-3, xmax=3, ymin=-1.69, ymax=1.69, width=3840, height=2160, out=None,
+            batched=True, adaptive=False, cache=None):
     """
     Create a fractal based on Jenkins-Traub.
 
@@ -313,17 +1009,46 @@ def fractal(P: Poly, xmin=-3, xmax=3, ymin=-1.69, ymax=1.69):
         Bottommost number. Default -1.69.
     ymax : float, optional
         Topmost number. Default 1.69.
+    width : int, optional
+        Number of horizontal points. Default 3840.
+    height : int, optional
+        Number of vertical points. Default 2160.
+    out : str, optional
+        When given, render tile by tile over every core into this
+        memory-mapped file (resuming if it was interrupted) and save
+        one pixel per value.
+    batched : bool, optional
+        Iterate all pixels in lockstep (default is True). False runs
+        simpleJK per pixel, which is far slower.
+    adaptive : bool, optional
+        Solve coarse to fine, only near basin boundaries, writing each
+        pass to "JenkinsTraubPreview.png". Default False.
+    cache : str, optional
+        Directory of finished tiles reused by later renders with out
+        at the same pixel pitch, for example pans. Default None.
     """
+    import matplotlib.pyplot as plt  # only needed for drawing
+    import TiledFractal
+    if out is not None:
+        z = TiledFractal.render(partial(countGrid, P, batched=batched), xmin, xmax, ymin, ymax,
+                                width, height, out, cache=cache)
+        TiledFractal.save(z, "JenkinsTraub.png")
+        return
+    if adaptive:
+        z, solved = TiledFractal.refine(partial(countGrid, P, batched=batched), xmin, xmax, ymin, ymax,
+                                        width, height, preview="JenkinsTraubPreview.png")
+        print("solved", solved, "of", width*height, "pixels")
+        TiledFractal.save(z, "JenkinsTraub.png")
+        return
     plt.figure(frameon=False)
     fig, ax = plt.subplots()
     fig.set_size_inches(19.1, 10.75)
     ax = plt.Axes(fig, [0., 0., 1., 1.])
     ax.set_axis_off()
     fig.add_axes(ax)
-    real, img = np.meshgrid(np.linspace(ymin, ymax, 2160),  # 3840 x 2160 is very hi-res takes a while
-                            np.linspace(xmin, xmax, 3840))
-    vjk = np.vectorize(simpleJK, excluded=['a'])
-    z = vjk(P, real + img * I, withCount=True)
+    img, real = np.meshgrid(TiledFractal.pixels(ymin, ymax, height),  # 3840 x 2160 is very hi-res takes a while
+                            TiledFractal.pixels(xmin, xmax, width))
+    z = countGrid(P, real, img, batched)  # same s = x + yi as out and adaptive
     ax.pcolormesh(real, img, z, vmin=z.min(), vmax=z.max(),
                   cmap=plt.get_cmap('ocean'), shading='nearest')
     plt.savefig("JenkinsTraub.png", transparent=True)
@@ -333,6 +1058,8 @@ def main():
     """
     Execute the Traub and simplified Jenkins-Traub methods.
     """
+    from sympy import Poly, symbols
+    x = symbols('x')
     # P = Poly(x**2 - x - 1)
     P = Poly(x**5 - 8*x**4 - 72*x**3 + 382*x**2 + 727*x - 2310)
     # P = Poly(x**3 - 1.0)
@@ -341,7 +1068,9 @@ def main():
     print("Traub G", traub1(P, s))
     print("Traub H", traub2(P, s))
     print("Jenkins", simpleJK(P, s))
+    print("All roots", jenkinsTraub(P))
     # fractal(P)  # uncomment to see fractal
+    # benchmark(P)  # uncomment to compare against SymPy
     print("done")
 
 
@@ -6,44 +6,195 @@
 # @author Oscar Veliz
 ############################
 import cmath
+from functools import partial
+import numpy as np
 def f(x):
-	return x**3 - x**2 - x - 1	
-xnm2 = 0
-xnm1 = 1
-xn = 2
-#xnm2 = -2
-#xnm1 = -1
-#xn = 0
-epsilon = 10**-7
-i = 0
-print("n\txn\t\tf(xn)")
-print("1\t"+str(xnm2)+"\t\t"+str(f(xnm2)))
-print("2\t"+str(xnm1)+"\t\t"+str(f(xnm1)))
-print("3\t"+str(xn)+"\t\t"+str(f(xn)))
-while(abs(f(xn)) > epsilon):
-	q = (xn - xnm1)/(xnm1 - xnm2)
-	a = q*f(xn) - q*(1+q)*f(xnm1) + q**2*f(xnm2)
-	b = (2*q + 1)*f(xn) - (1+q)**2*f(xnm1) + q**2*f(xnm2)
-	c = (1 + q)*f(xn)
-	#see which x intercept is better
-	r = xn - (xn - xnm1)*((2*c)/(b + cmath.sqrt(b**2 - 4*a*c)))
-	s = xn - (xn - xnm1)*((2*c)/(b - cmath.sqrt(b**2 - 4*a*c)))
-	if(abs(f(r)) < abs(f(s))):
-		xplus = r
-	else:
-		xplus = s
-	if xplus.imag == 0j:#result is real number
-		xplus = xplus.real
-		print(str(i + 4)+"\t"+str(round(xplus,5))+"\t\t"+str(round(f(xplus),5)))
-	else:
-		print(str(i + 4)+"\t{:.4f}".format(xplus)+"\t{:.4f}".format(f(xplus)))
-	xnm2 = xnm1
-	xnm1 = xn
-	xn = xplus
-	i = i + 1
-print(str(i)+" iterations")
-#when root is complex double check complex conjugate
-if isinstance(xplus, complex):
-	conjugate = complex(xplus.real, -xplus.imag)
-	if abs(f(conjugate)) < epsilon:
-		print("and \t{:.4f}".format(conjugate)+"\t{:.4f}".format(f(conjugate)))
+	return x**3 - x**2 - x - 1
+# Muller's Method on any f starting from xnm2, xnm1, xn
+# the last three f values are carried forward so each iteration costs a
+# single new evaluation of f, returns the root and how many evaluations
+# trace is an optional Trace that records every iteration instead of printing
+# report prints a warning when epsilon is not reached
+def muller(f, xnm2, xnm1, xn, epsilon=10**-7, maxiter=100, verbose=False, trace=None, report=True):
+	verbose = verbose and trace is None#any trace is quiet, even a disabled one
+	fnm2 = f(xnm2)
+	fnm1 = f(xnm1)
+	fn = f(xn)
+	evals = 3
+	i = 0
+	if verbose:
+		print("n\txn\t\tf(xn)")
+		print("1\t"+str(xnm2)+"\t\t"+str(fnm2))
+		print("2\t"+str(xnm1)+"\t\t"+str(fnm1))
+		print("3\t"+str(xn)+"\t\t"+str(fn))
+	while(abs(fn) > epsilon and i < maxiter):
+		q = (xn - xnm1)/(xnm1 - xnm2)
+		a = q*fn - q*(1+q)*fnm1 + q**2*fnm2
+		b = (2*q + 1)*fn - (1+q)**2*fnm1 + q**2*fnm2
+		c = (1 + q)*fn
+		#larger denominator gives the closer x intercept, no need to evaluate both
+		d = cmath.sqrt(b**2 - 4*a*c)
+		den = b + d if abs(b + d) >= abs(b - d) else b - d
+		if den == 0:#parabola is flat, no intercept
+			break
+		xplus = xn - (xn - xnm1)*((2*c)/den)
+		if xplus.imag == 0j:#result is real number
+			xplus = xplus.real
+		fplus = f(xplus)
+		evals = evals + 1
+		if trace is not None:
+			trace.record(i + 4, xplus, abs(fplus), abs(xplus - xn))
+		if verbose and isinstance(xplus, complex):
+			print(str(i + 4)+"\t{:.4f}".format(xplus)+"\t{:.4f}".format(fplus))
+		elif verbose:
+			print(str(i + 4)+"\t"+str(round(xplus,5))+"\t\t"+str(round(fplus,5)))
+		xnm2, fnm2 = xnm1, fnm1
+		xnm1, fnm1 = xn, fn
+		xn, fn = xplus, fplus
+		i = i + 1
+	if verbose:
+		print(str(i)+" iterations")
+	if report and abs(fn) > epsilon:#stopped at maxiter or a flat parabola
+		print("did not converge, |f(xn)| =", abs(fn))
+	return xn, evals
+# Muller's Method on arrays of starting triples xnm2, xnm1, xn run in lockstep
+# f must accept complex arrays, starts that converge or break down drop out
+# returns the root and number of iterations of every start
+def mullerGrid(f, xnm2, xnm1, xn, epsilon=10**-7, maxiter=100):
+	xnm2, xnm1, xn = np.broadcast_arrays(*(np.asarray(x, dtype=complex) for x in (xnm2, xnm1, xn)))
+	shape = xn.shape
+	xnm2, xnm1, xn = xnm2.ravel().copy(), xnm1.ravel().copy(), xn.ravel().copy()
+	fnm2, fnm1, fn = f(xnm2), f(xnm1), f(xn)
+	count = np.zeros(xn.size, dtype=int)
+	active = np.arange(xn.size)
+	with np.errstate(all='ignore'):#breakdowns give inf/nan and are dropped
+		for i in range(maxiter):
+			active = active[abs(fn[active]) > epsilon]
+			if active.size == 0:
+				break
+			x0, x1, x2 = xnm2[active], xnm1[active], xn[active]
+			f0, f1, f2 = fnm2[active], fnm1[active], fn[active]
+			q = (x2 - x1)/(x1 - x0)
+			a = q*f2 - q*(1+q)*f1 + q**2*f0
+			b = (2*q + 1)*f2 - (1+q)**2*f1 + q**2*f0
+			c = (1 + q)*f2
+			#larger denominator gives the closer x intercept
+			d = np.sqrt(b**2 - 4*a*c)
+			den = np.where(abs(b + d) >= abs(b - d), b + d, b - d)
+			xplus = x2 - (x2 - x1)*((2*c)/den)
+			ok = np.isfinite(xplus)
+			active, x1, x2, f1, f2, xplus = active[ok], x1[ok], x2[ok], f1[ok], f2[ok], xplus[ok]
+			xnm2[active], fnm2[active] = x1, f1
+			xnm1[active], fnm1[active] = x2, f2
+			xn[active], fn[active] = xplus, f(xplus)
+			count[active] += 1
+	return xn.reshape(shape), count.reshape(shape)
+# iterations of Muller started from (z - h, z + h, z) for every z = X + Yi
+def countGrid(f, X, Y, h=0.5):
+	z = np.asarray(X) + np.asarray(Y)*1j
+	return mullerGrid(f, z - h, z + h, z)[1]
+# basin fractal, horizontal is real and vertical imaginary, saved to "MullerFractal.png"
+# f must accept complex arrays, and be picklable when out is given
+# out renders tile by tile into that memory-mapped file, adaptive solves coarse to fine
+# and cache reuses tiles between renders, see TiledFractal
+def fractal(f=f, xmin=-3, xmax=3, ymin=-2, ymax=2, width=2000, height=1000, out=None, adaptive=False, cache=None):
+	import matplotlib.pyplot as plt#only needed for drawing
+	import TiledFractal
+	if out is not None:
+		z = TiledFractal.render(partial(countGrid, f), xmin, xmax, ymin, ymax, width, height, out, cache=cache)
+		TiledFractal.save(z, "MullerFractal.png")
+		return
+	if adaptive:
+		z, solved = TiledFractal.refine(partial(countGrid, f), xmin, xmax, ymin, ymax, width, height, preview="MullerPreview.png")
+		print("solved", solved, "of", width*height, "pixels")
+		TiledFractal.save(z, "MullerFractal.png")
+		return
+	plt.figure(frameon=False)
+	fig, ax = plt.subplots()
+	fig.set_size_inches(16, 10.75)
+	ax = plt.Axes(fig, [0., 0., 1., 1.])
+	ax.set_axis_off()
+	fig.add_axes(ax)
+	y, x = np.meshgrid(TiledFractal.pixels(ymin, ymax, height), TiledFractal.pixels(xmin, xmax, width))
+	z = countGrid(f, x, y)
+	ax.pcolormesh(x, y, z, vmin=z.min(), vmax=z.max(), cmap=plt.get_cmap('ocean'), shading='nearest')
+	plt.savefig("MullerFractal.png", transparent=True)
+# evaluate polynomial p = [a,b,c] for ax^2 + bx + c with Horner's Method
+def horner(p, x):
+	r = p[0]
+	for c in p[1:]:
+		r = r*x + c
+	return r
+# divide p by x - r, remainder is dropped
+def deflate(p, r):
+	q = [p[0]]
+	for c in p[1:-1]:
+		q.append(q[-1]*r + c)
+	return q
+# Muller on f from starts around a circle of radius 1/2 until one converges
+# returns the root, whether it converged, and the number of evaluations
+def search(f, epsilon=10**-10, maxiter=100, tries=8):
+	evals = 0
+	for k in range(tries):
+		z = 0.5*cmath.exp(1j*k) if k else 0#first try is the classic 0.5, -0.5, 0
+		x, n = muller(f, z + 0.5, z - 0.5, z, epsilon, maxiter, report=False)
+		evals = evals + n
+		if abs(f(x)) <= epsilon:
+			return x, True, evals
+	return x, False, evals
+# all roots of polynomial p = [a,b,c] by finding one root and deflating
+# q is always deflated by the root found on q, the root polished against the
+# original p is only kept when it stays close, otherwise polishing may land
+# on a root already found, when p is real and a complex root's conjugate is
+# also a root both are removed at once
+# returns the roots and the total number of evaluations
+def allRoots(p, epsilon=10**-10, maxiter=100):
+	real = all(complex(c).imag == 0 for c in p)
+	q = list(p)
+	roots = []
+	evals = 0
+	while len(q) > 2:
+		x, converged, n = search(lambda x: horner(q, x), epsilon, maxiter)
+		if not converged:
+			print("did not converge, |q(x)| =", abs(horner(q, x)), "at degree", len(q) - 1)
+		if real and isinstance(x, complex) and abs(x.imag) <= 10**-6*max(1, abs(x)):
+			x = x.real#imaginary part is only rounding, the conjugate would be the same root
+		polished, m = muller(lambda x: horner(p, x), x + 10**-3, x - 10**-3, x, epsilon, maxiter, report=False)
+		evals = evals + n + m
+		root = polished if abs(polished - x) <= 10**-6*max(1, abs(x)) else x
+		if not isinstance(x, complex):
+			root = complex(root).real
+		roots.append(root)
+		#when root is complex double check complex conjugate
+		if real and isinstance(x, complex) and len(q) > 3 and abs(horner(q, x.conjugate())) <= max(epsilon, abs(horner(q, x))):
+			roots.append(root.conjugate())
+			q = deflate(deflate(q, x), x.conjugate())
+			q = [c.real for c in q]#pair leaves a real quotient
+		else:
+			q = deflate(q, x)
+	if len(q) == 2:
+		roots.append(-q[1]/q[0])
+	return roots, evals
+def main():
+	xnm2 = 0
+	xnm1 = 1
+	xn = 2
+	#xnm2 = -2
+	#xnm1 = -1
+	#xn = 0
+	epsilon = 10**-7
+	xplus, evals = muller(f, xnm2, xnm1, xn, epsilon, verbose=True)
+	print(str(evals)+" evaluations of f")
+	#when root is complex double check complex conjugate
+	if isinstance(xplus, complex):
+		conjugate = complex(xplus.real, -xplus.imag)
+		if abs(f(conjugate)) < epsilon:
+			print("and \t{:.4f}".format(conjugate)+"\t{:.4f}".format(f(conjugate)))
+	roots, evals = allRoots([1, -1, -1, -1])
+	print("all roots", roots, "in "+str(evals)+" evaluations")
+	starts = np.linspace(-3, 3, 7) + 1j
+	roots, count = mullerGrid(f, starts - 0.5, starts + 0.5, starts)
+	print("from", starts, "\nroots", roots.round(5), "\niterations", count)
+	#fractal(f)#uncomment to see fractal
+if __name__ == "__main__":
+	main()
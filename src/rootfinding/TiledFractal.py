@@ -0,0 +1,522 @@
+"""Tiled Fractal Renderer.
+
+Splits the plane into square tiles and spreads them over a process pool.
+Every worker writes its tile straight into a shared memory-mapped result
+file, so only a few tiles are ever held in memory no matter how large the
+image is. A record of finished tiles is kept next to the result so a
+killed render picks up where it left off. Finished tiles can also be
+kept in a cache directory as compressed arrays keyed by the kernel, its
+parameters, the pixel pitch, and integer tile indices. Pixels and tiles
+sit on a global lattice of that pitch rather than starting at each
+window's corner, so repeated or overlapping renders at the same pitch,
+such as pans, read the tiles they share back instead of solving again.
+
+Basin images are mostly flat regions of equal count, so refine instead
+works coarse to fine: it solves a sparse lattice, fills every cell whose
+corners agree, and only halves the spacing inside cells whose corners
+disagree. Each level can be saved as a low resolution preview.
+
+Any kernel can be rendered as long as it takes arrays X and Y of the
+same shape and returns an array of iteration counts, for example
+functools.partial(Bairstow.bairstowGrid, p).
+
+@author: Oscar Veliz
+"""
+import hashlib
+import inspect
+import os
+import struct
+import zlib
+from functools import partial
+from multiprocessing import Pool
+import numpy as np
+
+
+def anchor(lo, hi, n):
+    """Place n pixels from lo to hi on a global lattice.
+
+    The pitch is rounded to 12 significant digits and the pixels are put
+    at integer multiples of it, plus an offset rounded to a millionth of
+    the pitch when lo is not on one, so every window with the same pitch
+    computes bit for bit the same coordinates for the pixels it shares.
+
+    Parameters
+    ----------
+    lo : float
+        First coordinate.
+    hi : float
+        Last coordinate.
+    n : int
+        Number of pixels.
+
+    Returns
+    -------
+    tuple
+        (step, offset, first) with pixel i of the window at
+        offset + (first + i) * step.
+    """
+    step = float("%.12g" % ((hi - lo) / (n - 1))) if n > 1 else 1.0
+    first = round(lo / step)
+    offset = round(lo / step - first, 6) * step  # phase to a millionth of a pixel
+    return step, offset, first
+
+
+def coordinates(axis, g0, g1):
+    """Coordinates of global pixels g0 up to g1 on one axis from anchor."""
+    step, offset, _ = axis
+    return offset + np.arange(g0, g1) * step
+
+
+def pixels(lo, hi, n):
+    """The n coordinates from lo to hi on the global lattice.
+
+    Use it in place of np.linspace so a plain render gives bit for bit the
+    same pixels as render and refine.
+    """
+    axis = anchor(lo, hi, n)
+    return coordinates(axis, axis[2], axis[2] + n)
+
+
+def tiles(width, height, size, x0=0, y0=0):
+    """List the tiles covering a width x height image.
+
+    Tiles are aligned to multiples of size on the global lattice, so with
+    x0 and y0 the global index of the first pixel the tiles along the
+    edges may be cut by the window.
+
+    Parameters
+    ----------
+    width : int
+        Number of horizontal pixels.
+    height : int
+        Number of vertical pixels.
+    size : int
+        Side length of each tile in pixels.
+    x0 : int, optional
+        Global index of the first horizontal pixel. Default 0.
+    y0 : int, optional
+        Global index of the first vertical pixel. Default 0.
+
+    Returns
+    -------
+    list of tuple
+        (i0, i1, j0, j1) slices of each tile in the window, horizontal
+        then vertical.
+    """
+    xs = range(x0 - x0 % size, x0 + width, size)
+    ys = range(y0 - y0 % size, y0 + height, size)
+    return [(max(i - x0, 0), min(i + size - x0, width), max(j - y0, 0), min(j + size - y0, height))
+            for i in xs for j in ys]
+
+
+def identify(obj):
+    """Stable description of one kernel parameter.
+
+    Callables are named by module and qualified name plus a hash of their
+    source, never by repr, which holds a memory address that changes from
+    run to run.
+
+    Parameters
+    ----------
+    obj : object
+        A bound argument or keyword value of a kernel.
+
+    Returns
+    -------
+    object
+        Something whose repr is the same in every process.
+    """
+    if isinstance(obj, partial):
+        return describe(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if callable(obj) and hasattr(obj, "__qualname__"):
+        try:  # an edited function gets new tiles
+            source = hashlib.sha256(inspect.getsource(obj).encode()).hexdigest()[:16]
+        except (OSError, TypeError):  # builtins and the interactive prompt have no source
+            source = ""
+        return getattr(obj, "__module__", "") + "." + obj.__qualname__ + ":" + source
+    return obj
+
+
+def describe(kernel):
+    """Describe a kernel by its function and every parameter it is run with.
+
+    Parameters
+    ----------
+    kernel : callable
+        The kernel, usually a functools.partial such as
+        partial(Bairstow.bairstowGrid, p).
+
+    Returns
+    -------
+    str
+        The function name, bound arguments such as the polynomial, and
+        the keyword parameters including defaults such as eps and max.
+    """
+    args, keywords, func = (), {}, kernel
+    if isinstance(kernel, partial):
+        args, keywords, func = kernel.args, kernel.keywords, kernel.func
+    defaults = {k: p.default for k, p in inspect.signature(kernel).parameters.items()
+                if p.default is not inspect.Parameter.empty}
+    defaults.update(keywords)
+    args = [identify(a) for a in args]
+    defaults = [(k, identify(v)) for k, v in sorted(defaults.items())]
+    return repr((identify(func), args, defaults))
+
+
+def tileKey(method, axes, tx, ty, size):
+    """Cache file name of a tile.
+
+    Parameters
+    ----------
+    method : str
+        Kernel description from describe.
+    axes : tuple
+        Horizontal and vertical lattices from anchor.
+    tx : int
+        Horizontal tile index on the global lattice.
+    ty : int
+        Vertical tile index on the global lattice.
+    size : int
+        Tile side length in pixels.
+
+    Returns
+    -------
+    str
+        Hex digest of the method, the pitch and offset of both axes, the
+        tile size, and the tile indices.
+    """
+    (sx, ox, _), (sy, oy, _) = axes
+    return hashlib.sha256(repr((method, sx, ox, sy, oy, size, tx, ty)).encode()).hexdigest() + ".npz"
+
+
+def evict(cache, limit):
+    """Delete least recently used tiles until the cache fits in limit bytes.
+
+    Parameters
+    ----------
+    cache : str
+        Cache directory.
+    limit : int
+        Largest total size in bytes to keep.
+    """
+    files = [os.path.join(cache, f) for f in os.listdir(cache) if f.endswith(".npz")]
+    stats = sorted((os.stat(f).st_mtime, os.stat(f).st_size, f) for f in files)
+    total = sum(size for _, size, _ in stats)
+    for _, size, f in stats:  # oldest first
+        if total <= limit:
+            break
+        os.remove(f)
+        total -= size
+
+
+def work(args):
+    """Compute one tile and write it into the result file.
+
+    With a cache directory the whole tile on the global lattice is used,
+    even where the window cuts it, so any later window can reuse it. A
+    tile already there is read back instead and its time is refreshed so
+    eviction keeps it.
+
+    Parameters
+    ----------
+    args : tuple
+        (kernel, out, shape, axes, size, tile, k, cache, method) where axes
+        are the lattices from anchor, tile the slices from tiles, k is the
+        index of the tile, cache is a directory or None, and method from
+        describe.
+
+    Returns
+    -------
+    int
+        The index k of the finished tile.
+    """
+    kernel, out, shape, axes, size, (i0, i1, j0, j1), k, cache, method = args
+    (_, _, x0), (_, _, y0) = axes
+    gx0, gx1, gy0, gy1 = x0 + i0, x0 + i1, y0 + j0, y0 + j1  # global pixels of the window part
+    if cache:
+        tx, ty = gx0 // size, gy0 // size
+        a, b = gx0 - tx*size, gy0 - ty*size  # window part inside the whole tile
+        name = os.path.join(cache, tileKey(method, axes, tx, ty, size))
+        gx0, gx1, gy0, gy1 = tx*size, (tx + 1)*size, ty*size, (ty + 1)*size
+    if cache and os.path.exists(name):
+        with np.load(name) as f:
+            tile = f["z"]
+        os.utime(name)
+    else:
+        Y, X = np.meshgrid(coordinates(axes[1], gy0, gy1), coordinates(axes[0], gx0, gx1))
+        tile = kernel(X, Y)
+        if cache:
+            tmp = name + ".%d.tmp" % os.getpid()
+            with open(tmp, "wb") as f:
+                np.savez_compressed(f, z=tile)
+            os.replace(tmp, name)  # never leave a half written tile
+    if cache:
+        tile = tile[a:a + i1 - i0, b:b + j1 - j0]
+    z = np.memmap(out, dtype=np.int32, mode='r+', shape=shape)
+    z[i0:i1, j0:j1] = tile
+    z.flush()
+    del z
+    return k
+
+
+def render(kernel, xmin=-3, xmax=3, ymin=-2, ymax=2, width=2000, height=1000,
+           out="fractal.dat", size=256, processes=None, cache=None, limit=2**30):
+    """Render a kernel over a rectangle of the plane into a memory-mapped file.
+
+    Result is stored as int32 with shape (width, height) so that z[i, j]
+    belongs to the i-th horizontal and j-th vertical coordinate, the same
+    layout np.meshgrid(y, x) gives in the fractal functions. Pixels are
+    placed by anchor on a global lattice whose pitch is that of linspace
+    rounded to 12 digits, so they may differ from linspace in the last
+    bits. Finished tiles are recorded in out + ".done" and the window
+    with a hash of the kernel in out + ".npy"; calling again with the
+    same window and kernel resumes from the finished tiles, anything
+    else starts over.
+
+    Parameters
+    ----------
+    kernel : callable
+        Picklable function kernel(X, Y) returning iteration counts.
+    xmin : float, optional
+        Leftmost number. Default -3.
+    xmax : float, optional
+        Rightmost number. Default 3.
+    ymin : float, optional
+        Bottommost number. Default -2.
+    ymax : float, optional
+        Topmost number. Default 2.
+    width : int, optional
+        Number of horizontal pixels. Default 2000.
+    height : int, optional
+        Number of vertical pixels. Default 1000.
+    out : str, optional
+        Result file. Default "fractal.dat".
+    size : int, optional
+        Tile side length in pixels, tiles are aligned to multiples of it
+        on the global lattice. Default 256.
+    processes : int, optional
+        Number of worker processes. Default is every core.
+    cache : str, optional
+        Directory of finished tiles shared between renders. Tiles are
+        reused when the kernel, its parameters, the pixel pitch and
+        offset, and the tile size match, so a window overlapping an
+        earlier one at the same pitch only solves its new tiles. A zoom
+        changes the pitch and shares nothing. Tiles cut by the window are
+        solved whole. Default None, no cache.
+    limit : int, optional
+        Size of the cache in bytes, least recently used tiles are
+        removed after the render. Default 2^30.
+
+    Returns
+    -------
+    np.memmap
+        Read-only view of the finished result.
+    """
+    shape = (width, height)
+    method = describe(kernel)
+    window = np.array([hashlib.sha256(method.encode()).hexdigest(),
+                       xmin, xmax, ymin, ymax, width, height, size], dtype=str)
+    axes = (anchor(xmin, xmax, width), anchor(ymin, ymax, height))
+    todo = tiles(width, height, size, axes[0][2], axes[1][2])
+    resume = (os.path.exists(out) and os.path.exists(out + ".done")
+              and os.path.exists(out + ".npy")
+              and np.array_equal(np.load(out + ".npy"), window))
+    if not resume:  # fresh render, throw away any stale files
+        np.memmap(out, dtype=np.int32, mode='w+', shape=shape).flush()
+        np.memmap(out + ".done", dtype=np.bool_, mode='w+', shape=(len(todo),)).flush()
+        np.save(out + ".npy", window)
+    done = np.memmap(out + ".done", dtype=np.bool_, mode='r+', shape=(len(todo),))
+    if cache is not None:
+        os.makedirs(cache, exist_ok=True)
+    jobs = [(kernel, out, shape, axes, size, t, k, cache, method)
+            for k, t in enumerate(todo) if not done[k]]
+    with Pool(processes) as pool:
+        for k in pool.imap_unordered(work, jobs):
+            done[k] = True  # only the parent touches the record
+            done.flush()
+    del done
+    if cache is not None:
+        evict(cache, limit)
+    return np.memmap(out, dtype=np.int32, mode='r', shape=shape)
+
+
+def lattice(n, step):
+    """Pixel indices spaced step apart, always including the last pixel.
+
+    Parameters
+    ----------
+    n : int
+        Number of pixels along the axis.
+    step : int
+        Spacing between lattice points.
+
+    Returns
+    -------
+    ndarray of int
+        Sorted indices 0, step, 2*step, ..., n-1.
+    """
+    return np.union1d(np.arange(0, n, step), [n - 1])
+
+
+def cells(idx, n):
+    """Cell of every pixel along one axis of the lattice.
+
+    Parameters
+    ----------
+    idx : ndarray of int
+        Lattice indices along the axis.
+    n : int
+        Number of pixels along the axis.
+
+    Returns
+    -------
+    tuple of ndarray
+        Cell below and cell above each pixel. They differ only for pixels
+        on a lattice line, which are shared by two cells.
+    """
+    p = np.arange(n)
+    last = len(idx) - 2
+    below = np.clip(np.searchsorted(idx, p, 'left') - 1, 0, last)
+    above = np.clip(np.searchsorted(idx, p, 'right') - 1, 0, last)
+    return below, above
+
+
+def uniform(z, ix, iy):
+    """Find the pixels lying only in cells whose four corners agree.
+
+    Parameters
+    ----------
+    z : ndarray
+        Counts with shape (width, height), known at the lattice points.
+    ix : ndarray of int
+        Horizontal lattice indices.
+    iy : ndarray of int
+        Vertical lattice indices.
+
+    Returns
+    -------
+    tuple of ndarray
+        Mask of pixels inside uniform cells and the value of their cell.
+        A pixel on a cell edge needs every cell it touches to agree.
+    """
+    c = z[np.ix_(ix, iy)]
+    corner = c[:-1, :-1]
+    same = (corner == c[1:, :-1]) & (corner == c[:-1, 1:]) & (corner == c[1:, 1:])
+    xs = cells(ix, z.shape[0])
+    ys = cells(iy, z.shape[1])
+    mask = np.ones(z.shape, dtype=bool)
+    for a in xs:
+        for b in ys:
+            mask &= same[np.ix_(a, b)]
+    return mask, corner[np.ix_(xs[0], ys[0])]
+
+
+def refine(kernel, xmin=-3, xmax=3, ymin=-2, ymax=2, width=2000, height=1000,
+           levels=3, preview=None):
+    """Render a kernel coarse to fine, solving only near basin boundaries.
+
+    The first pass solves every 2^levels-th pixel. Each following pass
+    fills the cells whose four corners have equal counts without solving
+    them, halves the spacing, and solves only the new lattice points that
+    are still unknown. Thin features that fit inside a uniform cell of
+    the first lattice can be missed, so lower levels trades speed for
+    safety. The layout and pixel coordinates are the same as render.
+
+    Parameters
+    ----------
+    kernel : callable
+        Function kernel(X, Y) returning iteration counts.
+    xmin : float, optional
+        Leftmost number. Default -3.
+    xmax : float, optional
+        Rightmost number. Default 3.
+    ymin : float, optional
+        Bottommost number. Default -2.
+    ymax : float, optional
+        Topmost number. Default 2.
+    width : int, optional
+        Number of horizontal pixels. Default 2000.
+    height : int, optional
+        Number of vertical pixels. Default 1000.
+    levels : int, optional
+        Number of halvings from the first lattice to full resolution.
+        Default 3, a first spacing of 8 pixels.
+    preview : str, optional
+        When given, the lattice of each pass is saved to this image file,
+        overwriting the previous, coarser one.
+
+    Returns
+    -------
+    tuple
+        Counts as int32 with shape (width, height) and the number of
+        pixels that were actually solved.
+    """
+    x = pixels(xmin, xmax, width)
+    y = pixels(ymin, ymax, height)
+    z = np.zeros((width, height), dtype=np.int32)
+    known = np.zeros((width, height), dtype=bool)
+    solved = 0
+    for level in range(levels, -1, -1):
+        step = 2**level
+        ix, iy = lattice(width, step), lattice(height, step)
+        if level < levels:  # fill from the coarser lattice of the last pass
+            mask, value = uniform(z, *last)
+            mask &= ~known
+            z[mask] = value[mask]
+            known |= mask
+        i, j = np.meshgrid(ix, iy, indexing='ij')
+        todo = ~known[i, j]
+        i, j = i[todo], j[todo]
+        if i.size:
+            z[i, j] = kernel(x[i], y[j])
+            known[i, j] = True
+            solved += i.size
+        if preview is not None:
+            save(z[np.ix_(ix, iy)], preview)
+        last = ix, iy
+    return z, solved
+
+
+def chunk(f, kind, data):
+    """Write one PNG chunk, its length, type, data and CRC."""
+    f.write(struct.pack(">I", len(data)) + kind + data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def save(z, filename="fractal.png", cmap='ocean', rows=256):
+    """Save an iteration-count array as a PNG, one pixel per value.
+
+    Unlike pcolormesh this never builds a figure, and the image is colored
+    and compressed a strip of rows at a time, so a memory-mapped 8K or 16K
+    render is never loaded whole. Horizontal is the first axis of z and
+    vertical the second, with the largest vertical value at the top.
+
+    Parameters
+    ----------
+    z : ndarray
+        Iteration counts with shape (width, height).
+    filename : str, optional
+        PNG file. Default "fractal.png".
+    cmap : str, optional
+        Matplotlib colormap name. Default 'ocean'.
+    rows : int, optional
+        Image rows held in memory at once. Default 256.
+    """
+    import matplotlib.pyplot as plt
+    width, height = z.shape
+    lo, hi = z.min(), z.max()
+    colors = plt.get_cmap(cmap)
+    compress = zlib.compressobj()
+    with open(filename, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0))  # 8-bit RGBA
+        for top in range(height, 0, -rows):  # PNG runs top down
+            strip = np.asarray(z[:, max(top - rows, 0):top], dtype=float)[:, ::-1].T
+            rgba = colors((strip - lo) / (hi - lo) if hi > lo else 0 * strip, bytes=True)
+            lines = np.zeros((len(rgba), 4*width + 1), dtype=np.uint8)  # leading 0, no filter
+            lines[:, 1:] = rgba.reshape(len(rgba), -1)
+            chunk(f, b"IDAT", compress.compress(lines.tobytes()))
+        chunk(f, b"IDAT", compress.flush())
+        chunk(f, b"IEND", b"")
@@ -0,0 +1,110 @@
+"""Iteration Trace Recorder.
+
+Records one row per iteration (iteration, iterate, residual, step size)
+into a preallocated NumPy record array and writes it out in bulk when
+the buffer fills, so long runs do not pay for a print per iteration.
+A path ending in ".csv" gives a CSV file, anything else a .npy record
+array. Trace() with no path is disabled and record does nothing.
+
+Solvers take it as an optional trace argument, for example
+Muller.muller(f, 0, 1, 2, trace=Trace("muller.npy")). Passing any trace,
+even a disabled Trace(), turns their printing off; only leaving trace out
+prints as before.
+
+@author: Oscar Veliz
+"""
+import os
+import numpy as np
+
+fields = np.dtype([("iteration", np.int64), ("iterate", np.complex128),
+                   ("residual", np.float64), ("step", np.float64)])
+
+
+class Trace:
+    """Buffered recorder of iteration rows.
+
+    Parameters
+    ----------
+    path : str, optional
+        Output file, CSV when it ends in ".csv" and .npy otherwise.
+        Default None, which disables the trace.
+    capacity : int, optional
+        Rows buffered between writes. Default 2^16.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether rows are kept.
+    rows : int
+        Number of rows recorded so far.
+    """
+
+    def __init__(self, path=None, capacity=2**16):
+        self.path = path
+        self.enabled = path is not None
+        self.rows = 0
+        if not self.enabled:
+            return
+        self.csv = path.endswith(".csv")
+        self.buffer = np.empty(capacity, dtype=fields)
+        self.n = 0
+        self.raw = path if self.csv else path + ".part"  # npy needs its length up front
+        self.file = open(self.raw, "w" if self.csv else "wb")
+        if self.csv:
+            self.file.write("iteration,real,imag,residual,step\n")
+
+    def record(self, iteration, iterate, residual=np.nan, step=np.nan):
+        """Buffer one row, writing the buffer out when it is full.
+
+        Parameters
+        ----------
+        iteration : int
+            Iteration number.
+        iterate : float or complex
+            Current approximation.
+        residual : float, optional
+            Size of f at the iterate. Default nan.
+        step : float, optional
+            Size of the last step. Default nan.
+        """
+        if not self.enabled:
+            return
+        self.buffer[self.n] = (iteration, iterate, residual, step)
+        self.n += 1
+        self.rows += 1
+        if self.n == len(self.buffer):
+            self.flush()
+
+    def flush(self):
+        """Write the buffered rows in one call."""
+        if not self.enabled or self.n == 0:
+            return
+        rows = self.buffer[:self.n]
+        if self.csv:
+            np.savetxt(self.file, np.column_stack([rows["iteration"], rows["iterate"].real,
+                                                   rows["iterate"].imag, rows["residual"],
+                                                   rows["step"]]),
+                       fmt=["%d", "%.17g", "%.17g", "%.17g", "%.17g"], delimiter=",")
+        else:
+            rows.tofile(self.file)
+        self.n = 0
+
+    def close(self):
+        """Flush and finish the file, a .npy is assembled from its raw rows."""
+        if not self.enabled or self.file.closed:
+            return
+        self.flush()
+        self.file.close()
+        if not self.csv:
+            out = np.lib.format.open_memmap(self.path, mode="w+", dtype=fields, shape=(self.rows,))
+            if self.rows:
+                out[:] = np.memmap(self.raw, dtype=fields, mode="r", shape=(self.rows,))
+            out.flush()
+            del out
+            os.remove(self.raw)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
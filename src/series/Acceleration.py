@@ -0,0 +1,181 @@
+import math
+from itertools import accumulate
+
+"""
+Series Acceleration
+
+Estimates the limit of a slowly converging series from a few dozen of
+its partial sums (or terms) with Aitken's Δ², the Shanks transform by
+Wynn's ε algorithm, Richardson extrapolation, and the Euler transform
+for alternating series. Each returns the estimate and an error estimate,
+the difference between the last two levels of the transform.
+
+Aitken, Wynn and Euler work on alternating or geometric-like errors such
+as Gregory-Leibniz, where 30 terms give π to machine precision. Sums
+like Σ 1/k² whose error shrinks like 1/n need Richardson instead.
+
+See Sublinear.py for how slowly Gregory-Leibniz converges without help.
+
+@author Oscar Veliz
+"""
+
+
+def aitken(S, iterate=True):
+    """Aitken's Δ² process, A_n = S_{n+2} - (ΔS_{n+1})² / Δ²S_n.
+
+    Parameters
+    ----------
+    S : iterable of float
+        Partial sums.
+    iterate : bool, optional
+        Apply Δ² again to the result until fewer than three values are
+        left. Default True.
+
+    Returns
+    -------
+    tuple
+        Estimate and error estimate.
+    """
+    S = list(S)
+    previous = S[-2] if len(S) > 1 else math.inf
+    while len(S) >= 3:
+        a, b, c = S[-3:]
+        if c - 2*b + a == 0:  # last triple is flat, nothing more to gain
+            break
+        A = [c if c - 2*b + a == 0 else c - (c - b)**2 / (c - 2*b + a)  # carry flat triples
+             for a, b, c in zip(S, S[1:], S[2:])]
+        previous, S = S[-1], A
+        if not iterate:
+            break
+    return S[-1], abs(S[-1] - previous)
+
+
+def wynn(S):
+    """Shanks transform of every order by Wynn's ε algorithm.
+
+    ε_{k+1}(n) = ε_{k-1}(n+1) + 1 / (ε_k(n+1) - ε_k(n)) with ε_{-1} = 0 and
+    ε_0 = S, the even columns ε_{2k} are the Shanks transforms.
+
+    Parameters
+    ----------
+    S : iterable of float
+        Partial sums.
+
+    Returns
+    -------
+    tuple
+        Last entry of the deepest even column and its distance from the
+        column before.
+    """
+    current = list(S)
+    before = [0.0] * (len(current) + 1)
+    estimates = [current[-1]]
+    k = 0
+    while len(current) > 1:
+        diffs = [b - a for a, b in zip(current, current[1:])]
+        if 0 in diffs:  # converged to machine precision, no deeper column
+            break
+        before, current = current, [before[i+1] + 1/d for i, d in enumerate(diffs)]
+        k += 1
+        if k % 2 == 0:
+            estimates.append(current[-1])
+    previous = estimates[-2] if len(estimates) > 1 else math.inf
+    return estimates[-1], abs(estimates[-1] - previous)
+
+
+def richardson(S, order=6):
+    """Richardson extrapolation for S_n = S + c_1/n + c_2/n² + ...
+
+    Eliminates the powers of 1/n with Neville's table over the last
+    order+1 partial sums, n being the number of terms. Suits sums with
+    terms of one sign such as Σ 1/k², not alternating ones.
+
+    Parameters
+    ----------
+    S : iterable of float
+        Partial sums S_1, S_2, ...
+    order : int, optional
+        Number of powers of 1/n to remove. Default 6.
+
+    Returns
+    -------
+    tuple
+        Estimate and error estimate.
+    """
+    S = list(S)
+    order = min(order, len(S) - 1)
+    n = list(range(len(S) - order, len(S) + 1))
+    T = S[-order-1:]
+    previous = math.inf
+    for j in range(1, order + 1):
+        previous = T[-1]
+        T = [(n[i+j]*T[i+1] - n[i]*T[i]) / (n[i+j] - n[i]) for i in range(len(T) - 1)]
+    return T[-1], abs(T[-1] - previous)
+
+
+def euler(terms):
+    """Euler transform of an alternating series Σ (-1)^k a_k.
+
+    Σ (-1)^k a_k = Σ (-1)^k Δ^k a_0 / 2^(k+1) with Δ the forward difference.
+
+    Parameters
+    ----------
+    terms : iterable of float
+        The signed terms, a_0, -a_1, a_2, ...
+
+    Returns
+    -------
+    tuple
+        Estimate and the size of the last term added.
+    """
+    a = [t if k % 2 == 0 else -t for k, t in enumerate(terms)]
+    total = 0.0
+    last = math.inf
+    for k in range(len(a)):
+        last = (-1)**k * a[0] / 2**(k+1)
+        total += last
+        a = [y - x for x, y in zip(a, a[1:])]
+    return total, abs(last)
+
+
+def accelerate(values, method="wynn", terms=False):
+    """Accelerate a series given its partial sums or its terms.
+
+    Parameters
+    ----------
+    values : iterable of float
+        Partial sums, or terms when terms is True.
+    method : str, optional
+        "aitken", "wynn", "richardson", or "euler". Default "wynn".
+    terms : bool, optional
+        Whether values are the terms instead of partial sums. Default False.
+
+    Returns
+    -------
+    tuple
+        Estimate and error estimate.
+    """
+    values = list(values)
+    if method == "euler":
+        if not terms:
+            values = [b - a for a, b in zip([0.0] + values, values)]
+        return euler(values)
+    if terms:
+        values = list(accumulate(values))
+    return {"aitken": aitken, "wynn": wynn, "richardson": richardson}[method](values)
+
+
+if __name__ == "__main__":
+    n = 30
+    leibniz = [4 * (-1)**k / (2*k + 1) for k in range(n)]
+    basel = [1 / k**2 for k in range(1, n + 1)]
+    print("Gregory-Leibniz, π =", math.pi)
+    print("plain", sum(leibniz), abs(sum(leibniz) - math.pi))
+    for method in ("aitken", "wynn", "euler"):
+        estimate, error = accelerate(leibniz, method, terms=True)
+        print(method, estimate, error, abs(estimate - math.pi))
+    print("Basel, π²/6 =", math.pi**2 / 6)
+    print("plain", sum(basel), abs(sum(basel) - math.pi**2 / 6))
+    for method in ("aitken", "wynn", "richardson"):
+        estimate, error = accelerate(basel, method, terms=True)
+        print(method, estimate, error, abs(estimate - math.pi**2 / 6))
@@ -0,0 +1,172 @@
+import importlib.util
+import math
+import os
+import time
+
+"""
+Binary splitting for e and Machin-type formulas for π
+
+A sum of n rational terms is split in half, each half is reduced to a
+few big integers, and the halves are joined with a handful of big
+multiplications. The numbers at the top of the tree are as large as the
+answer, so the run time is that of a few full size multiplications
+times log n instead of the n² digit operations of a spigot.
+
+e = Σ 1/k! and arctan(1/x) = Σ (-1)^k / ((2k+1) x^(2k+1)) are both done
+on Python integers, which multiply with Karatsuba.
+
+@author Oscar Veliz
+"""
+
+MACHIN = [(4, 5), (-1, 239)]  # π/4 = 4 arctan(1/5) - arctan(1/239)
+TAKANO = [(12, 49), (32, 57), (-5, 239), (12, 110443)]  # Kikuko Takano 1982
+
+
+def eSplit(a, b):
+    """Binary splitting of Σ_{k=a+1}^{b} 1/((a+1)(a+2)...k).
+
+    Returns
+    -------
+    tuple
+        P and Q with the sum equal to P/Q and Q = (a+1)(a+2)...b.
+    """
+    if b - a == 1:
+        return 1, b
+    m = (a + b) // 2
+    P1, Q1 = eSplit(a, m)
+    P2, Q2 = eSplit(m, b)
+    return P1*Q2 + P2, Q1*Q2
+
+
+def atanSplit(x, a, b):
+    """Binary splitting of Σ_{k=a}^{b-1} (-1)^k / ((2k+1) x^(2k+1)), scaled.
+
+    Returns
+    -------
+    tuple
+        Q, B, T where Q collects the powers of x and B the odd numbers
+        2k+1. For a = 0 the sum is T/(B*Q).
+    """
+    if b - a == 1:
+        q = x if a == 0 else x*x
+        return q, 2*a + 1, -1 if a % 2 else 1
+    m = (a + b) // 2
+    Q1, B1, T1 = atanSplit(x, a, m)
+    Q2, B2, T2 = atanSplit(x, m, b)
+    return Q1*Q2, B1*B2, B2*Q2*T1 + B1*T2
+
+
+def decimal(n, digits):
+    """Decimal string of 0 <= n < 10^digits padded to exactly digits long.
+
+    Divide and conquer, so it avoids the quadratic str(int) and its limit
+    on the number of digits.
+    """
+    if digits <= 1000:
+        return str(n).zfill(digits)
+    half = digits // 2
+    high, low = divmod(n, 10**half)
+    return decimal(high, digits - half) + decimal(low, half)
+
+
+def e(digits, guard=10):
+    """e to the given number of digits after the decimal point.
+
+    Parameters
+    ----------
+    digits : int
+        Digits after the decimal point.
+    guard : int, optional
+        Extra digits computed and cut off. Default 10.
+
+    Returns
+    -------
+    str
+        "2.71828..." with digits decimals.
+    """
+    n = 2
+    while math.lgamma(n + 1) / math.log(10) < digits + guard:  # terms until 1/n! is small
+        n *= 2
+    P, Q = eSplit(0, n)
+    fixed = (P + Q) * 10**(digits + guard) // Q // 10**guard
+    return "2." + decimal(fixed - 2*10**digits, digits)
+
+
+def arctan(x, scale):
+    """arctan(1/x) as the integer floor(arctan(1/x) * scale) up to an ulp or two.
+
+    Parameters
+    ----------
+    x : int
+        The integer x > 1.
+    scale : int
+        The fixed point scale, a power of 10.
+
+    Returns
+    -------
+    int
+        Fixed point value.
+    """
+    n = int(math.log10(scale) / (2 * math.log10(x))) + 2  # x^(2n) > scale
+    Q, B, T = atanSplit(x, 0, n)
+    return T * scale // (B * Q)
+
+
+def pi(digits, formula=MACHIN, guard=10):
+    """π to the given number of digits after the decimal point.
+
+    Parameters
+    ----------
+    digits : int
+        Digits after the decimal point.
+    formula : list of tuple, optional
+        Pairs (c, x) with π/4 = Σ c arctan(1/x). Default MACHIN.
+    guard : int, optional
+        Extra digits computed and cut off. Default 10.
+
+    Returns
+    -------
+    str
+        "3.14159..." with digits decimals.
+    """
+    scale = 10**(digits + guard)
+    fixed = 4 * sum(c * arctan(x, scale) for c, x in formula) // 10**guard
+    return "3." + decimal(fixed - 3*10**digits, digits)
+
+
+def spigotModule():
+    """Load e-spigot.py, which cannot be imported by name because of the dash."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "e-spigot.py")
+    spec = importlib.util.spec_from_file_location("e_spigot", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def benchmark(sizes=(100, 300, 1000, 3000, 10000, 30000, 100000)):
+    """Time binary splitting against the e-spigot to find the crossover.
+
+    Parameters
+    ----------
+    sizes : tuple of int, optional
+        Numbers of digits of e to compute.
+    """
+    spigot = spigotModule().spigot
+    print("digits\tspigot (s)\tsplitting (s)\tsame")
+    for n in sizes:
+        t = time.perf_counter()
+        a = "2." + "".join(spigot(n))
+        t1 = time.perf_counter() - t
+        t = time.perf_counter()
+        b = e(n)
+        t2 = time.perf_counter() - t
+        print(str(n) + "\t" + format(t1, ".4f") + "\t\t" + format(t2, ".4f") + "\t\t" + str(a == b))
+
+
+if __name__ == "__main__":
+    print(math.e)  # built-in to compare
+    print(e(100))
+    print(math.pi)
+    print(pi(100))
+    print(pi(100, TAKANO)[-10:], "Takano agrees" if pi(100, TAKANO) == pi(100) else "Takano differs")
+    # benchmark()  # uncomment to compare with e-spigot.py
@@ -0,0 +1,119 @@
+import math
+import numpy as np
+
+"""
+Online Convergence Order
+
+Estimates the order a and asymptotic constant m of e_{k+1} ≈ m e_k^a
+while a method runs, one iterate at a time, from the last three errors
+only. Without a known answer the error is the step |x_{k+1} - x_k|, or
+the caller may pass residuals. It also says when to stop, and when
+convergence has degraded so a caller can switch methods.
+
+Sublinear.py does the same after the fact from the whole error list.
+
+@author Oscar Veliz
+"""
+
+
+class Convergence:
+    """Streaming estimate of the convergence order and rate.
+
+    Parameters
+    ----------
+    tol : float, optional
+        Error at which the run counts as converged. Default 10^-12.
+    order : float, optional
+        Smallest acceptable order; below it (or with a growing error)
+        for patience updates in a row convergence counts as degraded.
+        Default 1.
+    patience : int, optional
+        Number of bad updates in a row before reporting "degraded".
+        Default 3.
+    residuals : bool, optional
+        Values passed to update are already errors or residuals rather
+        than iterates. Default False.
+
+    Attributes
+    ----------
+    a : float
+        Latest order estimate, nan until three errors are known.
+    m : float
+        Latest asymptotic constant e_{k+1} / e_k^a.
+    error : float
+        Latest error.
+    count : int
+        Number of updates.
+    """
+
+    def __init__(self, tol=10**-12, order=1.0, patience=3, residuals=False):
+        self.tol = tol
+        self.order = order
+        self.patience = patience
+        self.residuals = residuals
+        self.last = None  # previous iterate
+        self.e = [math.nan, math.nan]  # the two errors before the latest
+        self.error = math.nan
+        self.a = math.nan
+        self.m = math.nan
+        self.bad = 0
+        self.count = 0
+
+    def update(self, x):
+        """Take the next iterate (or residual) and report the state.
+
+        Parameters
+        ----------
+        x : float, complex or array_like
+            The iterate, a vector uses the largest component.
+
+        Returns
+        -------
+        str
+            "converged" once the error is within tol, "degraded" after
+            patience updates in a row with order below the minimum or a
+            growing error, otherwise "running".
+        """
+        self.count += 1
+        if self.residuals:
+            error = float(np.max(np.abs(x)))
+        elif self.last is None:
+            self.last = np.array(x, dtype=complex)
+            return "running"
+        else:
+            x = np.array(x, dtype=complex)
+            error = float(np.max(np.abs(x - self.last)))
+            self.last = x
+        e0, e1, e2 = self.e[1], self.error, error
+        self.e = [e0, e1]
+        self.error = error
+        if error <= self.tol:
+            return "converged"
+        if e0 > 0 and e1 > 0 and e0 != e1:  # nan compares false, so this waits for three
+            self.a = math.log(e2 / e1) / math.log(e1 / e0)
+            self.m = e2 / e1**self.a
+        if e2 >= e1 or self.a < self.order:
+            self.bad += 1
+        else:
+            self.bad = 0
+        return "degraded" if self.bad >= self.patience else "running"
+
+
+if __name__ == "__main__":
+    print("Newton on x² - 2")
+    c = Convergence()
+    x = 1.0
+    state = c.update(x)
+    while state == "running":
+        x = x - (x*x - 2) / (2*x)
+        state = c.update(x)
+        print(c.count, x, c.error, c.a, c.m, state)
+    print("Gregory-Leibniz, errors against π")
+    c = Convergence(residuals=True, order=1.05)
+    series = 0.0
+    for i in range(100):
+        series += (-1)**i / (2*i + 1)
+        state = c.update(4*series - math.pi)
+        if state != "running":
+            break
+    print(c.count, 4*series, c.error, c.a, c.m, state)
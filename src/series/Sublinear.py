@@ -5,7 +5,14 @@
 # @author Oscar Veliz
 ###########################
 import math
+import os
+import sys
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rootfinding"))
+from Trace import Trace
 itr = 30000
+trace = None  # Trace("Sublinear.npy") records n, ~π, e and step to a file instead of printing
+show = print if trace is None else lambda *args: None  # any trace, even Trace(), is quiet
+record = trace.record if trace is not None else lambda *args: None
 series = 0.0
 terms = []
 e = []
@@ -15,10 +22,15 @@ for i in range(itr):
     e.append(abs(4*series - math.pi))
 a = [0]
 m = [0]
-print("n ~π e a m")
-print(0,4*terms[0],e[0])
+show("n ~π e a m")
+show(0,4*terms[0],e[0])
+record(0,4*terms[0],e[0])
 for i in range(1,itr-1):
     a.append(math.log(e[i+1]/e[i]) / math.log(e[i]/e[i-1]))
     m.append(e[i+1]/(math.pow(e[i],a[i])))
-    print(i,4*terms[i],e[i],a[i],m[i])
-print(itr-1,4*terms[itr-1],e[itr-1],'-','-')
+    show(i,4*terms[i],e[i],a[i],m[i])
+    record(i,4*terms[i],e[i],4*abs(terms[i]-terms[i-1]))
+show(itr-1,4*terms[itr-1],e[itr-1],'-','-')
+record(itr-1,4*terms[itr-1],e[itr-1],4*abs(terms[itr-1]-terms[itr-2]))
+if trace is not None:
+    trace.close()
@@ -0,0 +1,132 @@
+import math
+import time
+from multiprocessing import Pool
+import numpy as np
+
+"""
+Chunked Parallel Summation
+
+Sums a series of n terms given by a vectorized term function, for n far
+too large to keep the terms or the partial sums around. Terms are made
+in NumPy chunks, each chunk is summed pairwise with the rounding error
+of every addition recovered by twoSum, the chunks are spread over a
+process pool, and the chunk sums are joined in order with Neumaier's
+compensated (improved Kahan) summation. Only the partial sums at the
+requested sample points are kept, so memory stays constant.
+
+See Sublinear.py for the term at a time version.
+
+@author Oscar Veliz
+"""
+
+
+def leibniz(i):
+    """Gregory-Leibniz terms (-1)^i / (2i+1), which sum to π/4."""
+    return (1 - 2*(i & 1)) / (2*i + 1.0)
+
+
+def neumaier(s, c, x):
+    """Add x to the sum s with running compensation c (Neumaier)."""
+    t = s + x
+    if abs(s) >= abs(x):
+        c += (s - t) + x
+    else:
+        c += (x - t) + s
+    return t, c
+
+
+def pairwise(x):
+    """Pairwise sum of x with the rounding errors of every level added back.
+
+    Each level adds neighbours with Knuth's twoSum, so the error of every
+    addition is known exactly and summed separately. The result is about
+    as accurate as summing in twice the working precision.
+
+    Returns
+    -------
+    tuple
+        The sum and its correction.
+    """
+    error = 0.0
+    while len(x) > 1:
+        if len(x) % 2:
+            x = np.append(x, 0.0)
+        a, b = x[0::2], x[1::2]
+        x = a + b
+        z = x - a
+        error += np.sum((a - (x - z)) + (b - z))
+    return (float(x[0]) if len(x) else 0.0), float(error)
+
+
+def chunk(args):
+    """Sum one chunk of terms, split at the sample points inside it.
+
+    Parameters
+    ----------
+    args : tuple
+        (term, start, stop, cuts) with cuts the sampled term counts n in
+        (start, stop].
+
+    Returns
+    -------
+    tuple
+        cuts and the pairwise sums of the pieces between them as (sum,
+        correction), one more piece than cuts.
+    """
+    term, start, stop, cuts = args
+    x = term(np.arange(start, stop, dtype=np.int64))
+    return cuts, [pairwise(p) for p in np.split(x, cuts - start)]
+
+
+def summation(term, n, samples=(), size=2**20, processes=None):
+    """Compensated sum of term(0) + ... + term(n-1) over a process pool.
+
+    Parameters
+    ----------
+    term : callable
+        Picklable function mapping an int64 array of indices to terms.
+    n : int
+        Number of terms.
+    samples : iterable of int, optional
+        Term counts k at which to keep the partial sum S_k. Default none.
+    size : int, optional
+        Terms per chunk. Default 2^20.
+    processes : int, optional
+        Number of worker processes. Default is every core.
+
+    Returns
+    -------
+    tuple
+        The sum, the sample points up to n, and the partial sums there.
+    """
+    samples = np.unique(np.asarray(list(samples), dtype=np.int64))
+    samples = samples[(samples > 0) & (samples <= n)]
+    starts = range(0, n, size)
+    jobs = ((term, a, min(a + size, n),
+             samples[np.searchsorted(samples, a, 'right'):np.searchsorted(samples, min(a + size, n), 'right')])
+            for a in starts)
+    s, c = 0.0, 0.0
+    partial = np.empty(len(samples))
+    k = 0
+    with Pool(processes) as pool:
+        for cuts, pieces in pool.imap(chunk, jobs):  # in order, so partial sums line up
+            for hi, lo in pieces[:-1]:
+                s, c = neumaier(s, c, hi)
+                c += lo
+                partial[k] = s + c
+                k += 1
+            hi, lo = pieces[-1]
+            s, c = neumaier(s, c, hi)
+            c += lo
+    return s + c, samples, partial
+
+
+if __name__ == "__main__":
+    n = 10**8
+    samples = [10**k for k in range(1, 9)]
+    t = time.perf_counter()
+    total, points, partial = summation(leibniz, n, samples)
+    print("n ~π e")
+    for k, S in zip(points, partial):
+        print(k, 4*S, abs(4*S - math.pi))
+    print(n, "terms in", round(time.perf_counter() - t, 2), "s")
@@ -1,26 +1,204 @@
 import math  # to compare with built in e
+import os
+import time
+import numpy as np
 
 """
 An implementation of e-spigot algorithm
 by Rabinowitz & Wagon 1995 for computing
 Euler's Number to any degree of accuracy
 
+e - 2 = 1/2! + 1/3! + 1/4! + ... is held as the mixed radix number
+A = [1, 1, 1, ...] with cell j over (j+2)!. Multiplying every cell by
+10^k and carrying right to left pushes the next k digits out of the
+leftmost cell, so each pass yields k digits at once. For long runs
+checkpointed keeps the cells in a memory-mapped file and appends the
+digits to a text file, so a killed run resumes from its last checkpoint.
+
 @author Oscar Veliz
 """
 
-n = 1006  # number of desired digits (add 6 for safety)
-A = n*[1]
-e = "2."  # start with leading 2
-for s in range(n):
-    for i in range(n):
-        A[i] = A[i] * 10
-    for j in range(n-1, -1, -1):  # start from right side
-        k = j + 2  # leftmost division is by 2 not 0
-        q = A[j] // k  # quotient
-        if j != 0:
-            A[j-1] = A[j-1] + q  # carry the quotient
-        else:
-            e = e + str(q)  # last quotient is digit of e
-        A[j] = A[j] % k  # remainder
-print(math.e)  # built-in to compare
-print(e[:-6])  # remove extra 6 spots
+
+def factorials(digits):
+    """log10((j+2)!) for every cell j up to the first past 10^digits."""
+    m = 1
+    while True:
+        logs = np.cumsum(np.log10(np.arange(2, m + 2)))
+        if logs[-1] > digits:
+            return logs[:np.searchsorted(logs, digits) + 1]
+        m *= 2
+
+
+def perPass(m):
+    """Largest k such that m cells in base 10^k cannot overflow int64."""
+    return int(math.log10(2**63 // (m + 2)))
+
+
+def chooseK(m, k=None):
+    """Digits per pass for m cells, perPass(m) unless k is given.
+
+    Raises
+    ------
+    ValueError
+        When k is below 1, or more than perPass(m) so the int64 cells
+        would overflow and give wrong digits.
+    """
+    if k is None:
+        return perPass(m)
+    if k < 1:
+        raise ValueError("k must be at least 1 digit per pass")
+    if k > perPass(m):
+        raise ValueError("k = %d digits per pass overflows int64 for %d cells, at most %d"
+                         % (k, m, perPass(m)))
+    return k
+
+
+def step(A, d, base):
+    """Multiply the cells A over divisors d by base and carry right to left.
+
+    The carries are found by whole array sweeps while most of them still
+    move, then only for the cells whose incoming carry moved. Carries die
+    out a few cells from where they start, so this is a handful of sweeps.
+
+    Returns
+    -------
+    tuple
+        The new remainders and the quotient out of the leftmost cell,
+        which is the next k digits.
+    """
+    t = A * base
+    q = t // d  # quotients without incoming carries
+    carry = np.zeros_like(A)  # carry[j] comes from cell j+1
+    moved = np.arange(len(A))
+    while moved.size > len(A) // 8:
+        carry[:-1] = q[1:]
+        new = (t + carry) // d
+        moved = np.flatnonzero(new != q)
+        q = new
+    changed = moved[moved > 0] - 1
+    while changed.size:
+        j = changed
+        carry[j] = q[j + 1]
+        new = (t[j] + carry[j]) // d[j]
+        moved = j[new != q[j]]
+        q[j] = new
+        changed = moved[moved > 0] - 1
+    return t + carry - q * d, q[0]
+
+
+def spigot(n, k=None, guard=10):
+    """Yield the first n digits of e after the decimal point, k at a time.
+
+    The remainders are kept in an int64 array and carried with step.
+    After each pass the trailing cells that can no longer reach the
+    remaining digits are dropped, so later passes get cheaper.
+
+    Parameters
+    ----------
+    n : int
+        Number of digits.
+    k : int, optional
+        Digits per pass, base 10^k. Default is the largest that cannot
+        overflow int64, perPass; a larger k raises ValueError.
+    guard : int, optional
+        Extra digits computed but never yielded. Default 10.
+
+    Yields
+    ------
+    str
+        The next k digits, fewer for the last pass.
+    """
+    total = n + guard
+    logs = factorials(total)
+    m = len(logs)
+    k = chooseK(m, k)
+    A = np.ones(m, dtype=np.int64)
+    d = np.arange(2, m + 2, dtype=np.int64)  # leftmost division is by 2 not 0
+    produced = 0
+    while produced < n:
+        keep = int(np.searchsorted(logs, total - produced)) + 1  # drop cells too small to matter
+        A, q = step(A[:keep], d[:keep], 10**k)
+        group = str(q).zfill(k)  # last quotient is the next digits of e
+        yield group[:n - produced]
+        produced += k
+
+
+def checkpointed(n, out="e.txt", k=None, guard=10, every=60):
+    """Write the first n digits of e to a file, resuming an interrupted run.
+
+    The cells live in the memory-mapped file out + ".state" next to a
+    header [n, k, guard, m, slot, produced in slot 0, produced in slot 1].
+    Every checkpoint first syncs the digits file, then writes the cells
+    into the slot not in use, and only then switches the header to it, so
+    a run killed at any point leaves one complete checkpoint. On restart
+    the digits file is cut back to that checkpoint and the run continues.
+    A state file for a different n, k or guard is thrown away.
+
+    Parameters
+    ----------
+    n : int
+        Number of digits.
+    out : str, optional
+        Digits after the decimal point are appended here. Default "e.txt".
+    k : int, optional
+        Digits per pass, base 10^k. Default as in spigot.
+    guard : int, optional
+        Extra digits computed but never written. Default 10.
+    every : float, optional
+        Seconds between checkpoints. Default 60.
+
+    Returns
+    -------
+    int
+        Number of digits in out, n when finished.
+    """
+    total = n + guard
+    logs = factorials(total)
+    m = len(logs)
+    k = chooseK(m, k)
+    header = [n, k, guard, m]
+    name = out + ".state"
+    resume = (os.path.exists(out) and os.path.exists(name)
+              and os.path.getsize(name) == 8 * (8 + 2*m)
+              and list(np.memmap(name, dtype=np.int64, mode='r', shape=(4,))) == header)
+    if not resume:  # fresh run, slot 0 holds the starting cells
+        S = np.memmap(name, dtype=np.int64, mode='w+', shape=(8 + 2*m,))
+        S[:4] = header
+        S[8:8 + m] = 1
+        S.flush()
+        open(out, "w").close()
+    S = np.memmap(name, dtype=np.int64, mode='r+', shape=(8 + 2*m,))
+    slot = int(S[4])
+    produced = int(S[5 + slot])
+    keep = int(np.searchsorted(logs, total - produced)) + 1
+    A = np.array(S[8 + slot*m:8 + slot*m + keep])
+    os.truncate(out, produced)  # drop digits written after the checkpoint
+    d = np.arange(2, m + 2, dtype=np.int64)
+    with open(out, "a") as f:
+        last = time.monotonic()
+        while produced < n:
+            keep = int(np.searchsorted(logs, total - produced)) + 1
+            A, q = step(A[:keep], d[:keep], 10**k)
+            group = str(q).zfill(k)[:n - produced]
+            f.write(group)
+            produced += len(group)
+            if produced == n or time.monotonic() - last >= every:
+                f.flush()
+                os.fsync(f.fileno())  # digits reach the disk before the state says so
+                slot = 1 - slot
+                S[8 + slot*m:8 + slot*m + len(A)] = A
+                S.flush()
+                S[5 + slot] = produced
+                S.flush()
+                S[4] = slot  # switch last
+                S.flush()
+                last = time.monotonic()
+    del S
+    return produced
+
+
+if __name__ == "__main__":
+    n = 1000  # number of desired digits
+    print(math.e)  # built-in to compare
+    print("2." + "".join(spigot(n)))
+    # checkpointed(10**6)  # uncomment for a long run into e.txt that resumes if killed
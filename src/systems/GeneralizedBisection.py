@@ -4,12 +4,19 @@ Method of Bisecting Triangles to solve a System
 of Nonlinear Equations using simplified version
 of Harvey-Stenger 2D Analogue Method.
 
-Requires numpy and matplotlib.
+Requires numpy, and matplotlib for drawing. Matplotlib is only
+imported once drawTri or setup is called.
+
+bisection works on any F(x, y). Every vertex keeps its F value and every
+triangle its side lengths, so each step evaluates F only at the new
+midpoint and the new center, and measures only the one new side.
+allRoots triangulates a whole rectangle and bisects every triangle that
+may hold a root over a process pool to find all solutions inside it.
 
 :author: Oscar Veliz
 """
+from multiprocessing import Pool
 import numpy as np
-import matplotlib.pyplot as plt
 
 
 def F(x, y):
@@ -95,8 +102,224 @@ def rotate(T):
         return np.array([A, C, B])
 
 
+def vertex(F, P):
+    """Pair a point with its F value
+    :param F: function F(x, y) returning a pair
+    :param P: [x,y] point as ndarray
+    :return: (P, F(P)) with F(P) as ndarray
+    """
+    return (P, np.array(F(P[0], P[1]), dtype=float))
+
+
+def order(opposite):
+    """Vertex order that makes AB longest, the same choice as rotate
+    :param opposite: lengths of the sides opposite A, B, and C
+    :return: indices of the vertices in their new order
+    """
+    bc, ca, ab = opposite
+    if ab >= bc and bc >= ca:
+        return (0, 1, 2)
+    elif ab >= ca and ca >= bc:
+        return (1, 0, 2)
+    elif bc >= ca and ca >= ab:
+        return (1, 2, 0)
+    elif bc >= ab and ab >= ca:
+        return (2, 1, 0)
+    elif ca >= ab and ab >= bc:
+        return (2, 0, 1)
+    else:
+        return (0, 2, 1)
+
+
+def triangle(V):
+    """Triangle state from three vertices, measuring all three sides
+    :param V: list of three (point, F value) vertices
+    :return: (V, lengths of the sides opposite each vertex)
+    """
+    A, B, C = (P for P, _ in V)
+    return (V, [np.linalg.norm(B-C), np.linalg.norm(C-A), np.linalg.norm(A-B)])
+
+
+def bisection(F, R, S, eps=10**-6, maxiter=100, draw=None):
+    """Generalized bisection of triangles for F(x, y) = (0, 0)
+    Starts from two triangles sharing a side, keeps the one whose image
+    under F holds the origin, makes its longest side AB, and splits it
+    at the midpoint D of AB into ADC and DBC. F is called once for each
+    new point and only the new side DC is measured.
+    :param F: function F(x, y) returning a pair
+    :param R: first triangle as matrix of 3 points
+    :param S: second triangle as matrix of 3 points
+    :param eps: stop when |F(E)| or the longest side is below eps, default 10^-6
+    :param maxiter: maximum number of bisections, default 100
+    :param draw: optional function called with each chosen triangle
+    :return: (E, T, i, evals) center E of the last triangle T, number of
+             steps, and number of evaluations of F; T is None when
+             neither triangle's image under F holds the origin
+    """
+    evals = [0]
+
+    def G(x, y):
+        evals[0] += 1
+        return F(x, y)
+    cache = {}
+    for P in np.vstack([R, S]):  # shared starting vertices are evaluated once
+        if tuple(P) not in cache:
+            cache[tuple(P)] = vertex(G, P)
+    R = triangle([cache[tuple(P)] for P in R])
+    S = triangle([cache[tuple(P)] for P in S])
+    E = np.array(list(cache)).mean(axis=0)  # center of the distinct vertices
+    FE = vertex(G, E)[1]
+    longest = max(max(R[1]), max(S[1]))
+    zero = np.zeros(2)
+    T = np.array([P for P, _ in R[0]])
+    i = 0
+    while np.linalg.norm(FE) >= eps and longest >= eps and i < maxiter:
+        if check(np.array([FP for _, FP in R[0]]), zero):
+            V, opposite = R
+        elif check(np.array([FP for _, FP in S[0]]), zero):
+            V, opposite = S
+        else:  # for safety, when neither contains zero
+            T = None
+            break
+        k = order(opposite)
+        V = [V[j] for j in k]
+        bc, ca, ab = (opposite[j] for j in k)
+        (A, _), (B, _), (C, _) = V
+        T = np.array([A, B, C])
+        if draw is not None:
+            draw(T)
+        E = center(T)
+        FE = vertex(G, E)[1]
+        D = vertex(G, (A+B)/2.0)
+        dc = np.linalg.norm(D[0]-C)
+        longest = ab
+        R = ([V[0], D, V[2]], [dc, ca, ab/2.0])
+        S = ([D, V[1], V[2]], [bc, dc, ab/2.0])
+        i += 1
+    return E, T, i, evals[0]
+
+
+def excluded(V, opposite, margin=2.0):
+    """Cheap test that a triangle cannot hold a root of F
+    True when the image of the vertices misses the origin (check) and
+    some component of F has the same sign at all three vertices with
+    every value farther from zero than margin times the largest slope
+    along a side times the longest side. Assumes F is close to linear
+    at the scale of the triangle.
+    :param V: list of three (point, F value) vertices
+    :param opposite: lengths of the sides opposite each vertex
+    :param margin: safety factor on the linear estimate, default 2
+    :return: True when the triangle can be dropped
+    """
+    FV = np.array([FP for _, FP in V])
+    if check(FV, np.zeros(2)):
+        return False
+    sides = ((1, 2, opposite[0]), (2, 0, opposite[1]), (0, 1, opposite[2]))
+    longest = max(opposite)
+    for f in FV.T:
+        slope = max(abs(f[a] - f[b]) / n for a, b, n in sides if n > 0)
+        if (np.all(f > 0) or np.all(f < 0)) and np.min(abs(f)) > margin*slope*longest:
+            return True
+    return False
+
+
+def subdivide(args):
+    """Bisect one starting triangle down to every root inside it
+    Keeps a stack of triangles, drops those that are excluded, and
+    splits the rest at the midpoint of their longest side until it is
+    shorter than eps, when the center is a root if check passes.
+    :param args: (F, T, eps, maxtri) with T a matrix of 3 points and
+                 maxtri the most triangles to visit
+    :return: (roots, evals, unfinished) list of root points, evaluations
+             of F, and triangles left on the stack when maxtri was reached
+    """
+    F, T, eps, maxtri = args
+    evals = [0]
+
+    def G(x, y):
+        evals[0] += 1
+        return F(x, y)
+    stack = [triangle([vertex(G, P) for P in T])]
+    roots = []
+    visited = 0
+    while stack and visited < maxtri:
+        V, opposite = stack.pop()
+        visited += 1
+        if excluded(V, opposite):
+            continue
+        k = order(opposite)
+        V = [V[j] for j in k]
+        bc, ca, ab = (opposite[j] for j in k)
+        (A, _), (B, _), (C, _) = V
+        if ab < eps:
+            if check(np.array([FP for _, FP in V]), np.zeros(2)):
+                roots.append(center(np.array([A, B, C])))
+            continue
+        D = vertex(G, (A+B)/2.0)
+        dc = np.linalg.norm(D[0]-C)
+        stack.append(([V[0], D, V[2]], [dc, ca, ab/2.0]))
+        stack.append(([D, V[1], V[2]], [bc, dc, ab/2.0]))
+    return roots, evals[0], len(stack)
+
+
+def triangulate(xmin, xmax, ymin, ymax, nx, ny):
+    """Split a rectangle into a grid of nx by ny cells of two triangles each
+    :return: list of triangles as matrices of 3 points
+    """
+    x = np.linspace(xmin, xmax, nx + 1)
+    y = np.linspace(ymin, ymax, ny + 1)
+    tris = []
+    for i in range(nx):
+        for j in range(ny):
+            A = np.array([x[i], y[j]])
+            B = np.array([x[i+1], y[j]])
+            C = np.array([x[i+1], y[j+1]])
+            D = np.array([x[i], y[j+1]])
+            tris += [np.array([A, B, C]), np.array([A, C, D])]
+    return tris
+
+
+def allRoots(F, xmin=-3.5, xmax=3.5, ymin=-2, ymax=2, nx=8, ny=8, eps=10**-8, tol=10**-6,
+             maxtri=10**5, processes=None):
+    """Every root of F(x, y) = (0, 0) inside a rectangle
+    The rectangle is split into 2*nx*ny triangles which are subdivided
+    over a process pool. Roots found from neighbouring triangles closer
+    than tol are merged into one.
+    :param F: picklable function F(x, y) returning a pair
+    :param xmin: leftmost x, default -3.5
+    :param xmax: rightmost x, default 3.5
+    :param ymin: bottommost y, default -2
+    :param ymax: topmost y, default 2
+    :param nx: number of cells along x, default 8
+    :param ny: number of cells along y, default 8
+    :param eps: side length at which a triangle is a root, default 10^-8
+    :param tol: distance below which two roots are the same, default 10^-6
+    :param maxtri: most triangles visited per starting triangle, default 10^5
+    :param processes: number of worker processes, default every core
+    :return: (roots, evals, unfinished) roots as rows of an ndarray,
+             evaluations of F, and triangles never searched because a job
+             reached maxtri; when unfinished is not 0 roots may be missing
+    """
+    jobs = [(F, T, eps, maxtri) for T in triangulate(xmin, xmax, ymin, ymax, nx, ny)]
+    found = []
+    evals = 0
+    unfinished = 0
+    with Pool(processes) as pool:
+        for roots, n, left in pool.imap_unordered(subdivide, jobs):
+            found += roots
+            evals += n
+            unfinished += left
+    unique = []
+    for r in found:
+        if all(np.linalg.norm(r - u) >= tol for u in unique):
+            unique.append(r)
+    unique.sort(key=lambda r: (r[0], r[1]))
+    return np.array(unique).reshape(-1, 2), evals, unfinished
+
+
 def drawTri(T):
     """Draws a triangle given matrix with three points"""
+    import matplotlib.pyplot as plt
     s = np.vstack([T, T[0, :]])
     x = s[:, 0]
     y = s[:, 1]
@@ -112,6 +335,7 @@ def setup(d=(-3.5, 3.5), r=(-2, 2), size=(16, 9), res=100000):
     :param res: number of points in plot, default 1000000
                 Lower the res if it is taking too long to plot
     """
+    import matplotlib.pyplot as plt
     x = np.linspace(d[0], d[1], res)
     y = x**2 - 1  # x² - y - 1
     plt.figure(figsize=size)
@@ -130,6 +354,7 @@ def main():
     """Implementation of 2D Bisection based on simplified
     version of Harvey-Stenger 2D Analogue
     """
+    import matplotlib.pyplot as plt
     setup()
     A = np.array([1.0, 0.5])
     B = np.array([1.5, 2.0])
@@ -139,35 +364,12 @@ def main():
     S = np.array([A, D, C])
     drawTri(R)
     drawTri(S)
-    i = 0
-    eps = 10**-6
-    zero = np.zeros(2)
-    E = (A+B+C+D)/4
-    longest = max(np.linalg.norm(C-A), np.linalg.norm(D-B))
-    while np.linalg.norm(npF(E)) >= eps and longest >= eps and i < 100:
-        evalR = eval(R)
-        evalS = eval(S)
-        # drawTri(evalR) # uncomment to see searched area
-        # drawTri(evalS) # uncomment to see searched area
-        if check(evalR, zero):
-            T = R
-            # print("R") # uncomment to see choice
-        elif check(evalS, zero):  # change to else for efficiency
-            T = S
-            # print("S") # uncomment to see choice
-        else:  # for safety, when neither contains zero
-            print("problem")
-            break
-        T = rotate(T)
-        drawTri(T)
-        A, B, C = triToPoints(T)
-        E = center(T)
-        D = (A+B)/2.0
-        longest = np.linalg.norm(B-A)
-        R = np.array([A, D, C])
-        S = np.array([D, B, C])
-        i += 1
+    E, T, i, evals = bisection(F, R, S, draw=drawTri)
+    if T is None:  # neither triangle contains zero
+        print("problem")
     print(E, np.linalg.norm(npF(E)), i)
+    # print(evals, "evaluations of F") # uncomment to see cost
+    # print(allRoots(F)) # uncomment to find every root in the plot
     print(T)
     plt.plot(0, 0, marker="+", markersize=7, markeredgecolor="black")
     #plt.plot(E[0], E[1], marker=".",markersize=7,markerfacecolor="black", markeredgecolor="black")